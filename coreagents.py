@@ -2,12 +2,21 @@
 # Updated with URL Support for orchestration capabilities
 
 from fastapi import APIRouter, HTTPException, Body, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, validator
+import orjson
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from collections import defaultdict, deque
+from functools import lru_cache, partial
+from itertools import islice
+from graphlib import TopologicalSorter
+from urllib.parse import urlsplit
 import asyncio
-import re
+import random
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
 # ============ IMPORT URL EXTRACTOR ============
@@ -15,13 +24,81 @@ import url_extractor
 
 router = APIRouter()
 
+# Shared HTTP session: reuses pooled TCP/TLS connections across agent calls
+# instead of paying a fresh handshake per request
+_HTTP = requests.Session()
+_HTTP.mount("http://", HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+_HTTP.mount("https://", HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+
+def get_http_session() -> requests.Session:
+    """Return the shared pooled session for agent HTTP calls"""
+    return _HTTP
+
 
 # ============ IN-MEMORY STORAGE ============
 micro_agents_registry = {}
 micro_agents_dependencies = {}
-action_logs = []
+micro_agents_blocking = {}
+# Bounded ring buffers: the orchestrator is long-running, so logs must not
+# grow without limit. Per-agent buffers avoid full-log scans in /agent_status.
+action_logs = deque(maxlen=10000)
+_per_agent_logs = defaultdict(lambda: deque(maxlen=500))
 status_summary = {}
 
+# Reverse adjacency (dep -> agents that depend on it), built at registration
+# so /agent_dependencies never rescans the whole dependency dict
+_dependents = defaultdict(list)
+
+# Incremental success/failed tallies so dashboard endpoints avoid
+# rescanning status_summary on every poll
+_status_counts = {"success": 0, "failed": 0}
+
+# Most recent run timestamp, tracked incrementally so polling endpoints
+# don't max() over every agent (ISO-8601 strings compare lexicographically)
+_last_execution_ts = "never"
+
+
+def _set_agent_status(agent_name: str, status: str, details, timestamp: str):
+    """Update an agent's status and keep the per-bucket counters in sync"""
+    global _last_execution_ts
+    previous = status_summary.get(agent_name)
+    if previous:
+        _status_counts[previous["status"]] -= 1
+    _status_counts[status] += 1
+    status_summary[agent_name] = {
+        "status": status,
+        "details": details,
+        "last_run": timestamp
+    }
+    if _last_execution_ts == "never" or timestamp > _last_execution_ts:
+        _last_execution_ts = timestamp
+
+# Registry version bumps on every registration; caches keyed on it stay
+# valid for as long as the registry is unchanged (i.e. after import, forever)
+_registry_version = 0
+_topo_cache = (-1, [])
+
+# Phase -> agents mapping is static; build it (and the membership set /
+# error message) once instead of per request
+PHASE_AGENTS = {
+    "phase_1_foundation": ["robots_txt_management", "xml_sitemap_generator", "canonical_tag_management"],
+    "phase_2_onpage": ["title_tag_optimizer", "meta_description_generator", "header_tag_manager"],
+    "phase_3_technical": ["page_speed_analyzer", "mobile_usability_tester", "schema_markup_validator"],
+    "phase_4_content": ["content_quality_depth", "keyword_mapping", "internal_links_agent"],
+    "phase_5_offpage": ["backlink_analyzer", "social_signal_tracker", "brand_mention_outreach"]
+}
+VALID_PHASES = frozenset(PHASE_AGENTS)
+_VALID_PHASES_MSG = ", ".join(sorted(VALID_PHASES))
+
 
 # ============ PYDANTIC MODELS WITH URL SUPPORT ============
 
@@ -43,12 +120,7 @@ class SiteData(BaseModel):
     def extract_domain(cls, v, values):
         """Auto-extract domain from URL if not provided"""
         if not v and 'url' in values and values['url']:
-            try:
-                url = values['url']
-                domain = re.search(r'(?:https?://)?(?:www\.)?([^/]+)', url)
-                return domain.group(1) if domain else None
-            except:
-                return v
+            return extract_domain_from_url(values['url'])
         return v
 
 
@@ -71,118 +143,182 @@ class AgentExecutionRequest(BaseModel):
 
 # ============ HELPER FUNCTIONS ============
 
+def _now_iso() -> str:
+    """Current timestamp as ISO-8601 string - capture once and reuse per call"""
+    return datetime.now().isoformat()
+
+
 async def run_in_thread(func, *args, **kwargs):
     """Execute blocking function in thread pool"""
     return await asyncio.to_thread(func, *args, **kwargs)
 
 
-def extract_domain_from_url(url: str) -> str:
-    """Extract domain from URL"""
+@lru_cache(maxsize=4096)
+def extract_domain_from_url(url: str) -> Optional[str]:
+    """Extract domain from URL (cached - the same site is analyzed across phases)"""
     try:
-        domain = re.search(r'(?:https?://)?(?:www\.)?([^/]+)', url)
-        return domain.group(1) if domain else None
-    except:
+        host = urlsplit(url if '://' in url else 'http://' + url).hostname
+    except ValueError:
+        # urlsplit raises on malformed bracket hosts ("http://[bad")
         return None
+    return host[4:] if host and host.startswith('www.') else host
+
+
+def _register(name: str, func, dependencies: tuple = (), blocking: bool = False):
+    """Record an agent in the registry tables; returns func for decorator use"""
+    global _registry_version
+    if name in micro_agents_registry:
+        raise ValueError(f"Agent {name} is already registered")
+    micro_agents_registry[name] = func
+    micro_agents_dependencies[name] = dependencies
+    micro_agents_blocking[name] = blocking
+    for dep in dependencies:
+        _dependents[dep].append(name)
+    _registry_version += 1
+    return func
+
 
+def register_micro_agent(name: str, dependencies: List[str] = None, blocking: bool = False):
+    """Register a micro agent with optional dependencies.
 
-def register_micro_agent(name: str, dependencies: List[str] = None):
-    """Register a micro agent with optional dependencies"""
-    dependencies = dependencies or []
-    def decorator(func):
-        micro_agents_registry[name] = func
-        micro_agents_dependencies[name] = dependencies
-        return func
-    return decorator
+    Mark agents that do blocking I/O (requests.get, BeautifulSoup parsing)
+    with blocking=True so they run in the thread pool; pure-Python agents
+    are called inline to skip the executor round-trip.
+    """
+    # partial avoids allocating a fresh closure per registration, and the
+    # tuple-typed dependencies are hashable for downstream caches
+    return partial(_register, name,
+                   dependencies=tuple(dependencies or ()),
+                   blocking=blocking)
 
 
 def prioritize_agents() -> List[str]:
-    """Topological sort to determine execution order based on dependencies"""
-    result = []
-    temp_marked = set()
-    perm_marked = set()
-
-    def visit(agent):
-        if agent in perm_marked:
-            return
-        if agent in temp_marked:
-            raise Exception(f"Circular dependency detected at {agent}")
-
-        temp_marked.add(agent)
-        for dep in micro_agents_dependencies.get(agent, []):
+    """Topological sort (iterative Kahn's algorithm) to determine execution order.
+
+    The result is cached against the registry version, so repeat calls from
+    /agents, /trigger_all_agents etc. are a tuple compare + list copy.
+    """
+    global _topo_cache
+    cached_version, cached_order = _topo_cache
+    if cached_version == _registry_version:
+        return list(cached_order)
+
+    # Common case: no agent declares dependencies - registration order is valid
+    if not any(micro_agents_dependencies.values()):
+        order = list(micro_agents_registry)
+        _topo_cache = (_registry_version, order)
+        return list(order)
+
+    in_degree = {agent: 0 for agent in micro_agents_registry}
+    successors = {agent: [] for agent in micro_agents_registry}
+
+    for agent, deps in micro_agents_dependencies.items():
+        for dep in deps:
             if dep not in micro_agents_registry:
                 raise Exception(f"Dependency {dep} not found for agent {agent}")
-            visit(dep)
+            in_degree[agent] += 1
+            successors[dep].append(agent)
+
+    ready = deque(agent for agent, deg in in_degree.items() if deg == 0)
+    order = []
 
-        perm_marked.add(agent)
-        temp_marked.remove(agent)
-        result.append(agent)
+    while ready:
+        agent = ready.popleft()
+        order.append(agent)
+        for succ in successors[agent]:
+            in_degree[succ] -= 1
+            if in_degree[succ] == 0:
+                ready.append(succ)
 
-    for agent in micro_agents_registry.keys():
-        if agent not in perm_marked:
-            visit(agent)
+    if len(order) != len(micro_agents_registry):
+        remaining = set(micro_agents_registry) - set(order)
+        raise Exception(f"Circular dependency detected at {sorted(remaining)[0]}")
 
-    return result
+    _topo_cache = (_registry_version, order)
+    return list(order)
 
 
 async def run_micro_agent(agent_name: str) -> Dict[str, Any]:
     """Execute a single micro agent with error handling"""
     try:
-        # Run the agent function in a thread pool to avoid blocking
-        result = await asyncio.to_thread(micro_agents_registry[agent_name])
-
+        # Only blocking agents pay for the thread-pool hop; trivial
+        # pure-Python agents are cheaper to call inline
+        if micro_agents_blocking.get(agent_name):
+            result = await asyncio.to_thread(micro_agents_registry[agent_name])
+        else:
+            result = micro_agents_registry[agent_name]()
+
+        ts = _now_iso()
         log_entry = {
             "agent": agent_name,
             "success": True,
             "message": "Executed successfully",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
         action_logs.append(log_entry)
+        _per_agent_logs[agent_name].append(log_entry)
 
-        status_summary[agent_name] = {
-            "status": "success",
-            "details": result,
-            "last_run": datetime.now().isoformat()
-        }
+        _set_agent_status(agent_name, "success", result, ts)
 
         return result
     except Exception as e:
+        ts = _now_iso()
         log_entry = {
             "agent": agent_name,
             "success": False,
             "message": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts
         }
         action_logs.append(log_entry)
+        _per_agent_logs[agent_name].append(log_entry)
+
+        _set_agent_status(agent_name, "failed", str(e), ts)
+
+        raise Exception(f"Agent {agent_name} failed: {str(e)}") from e
+
+
+# Logic errors won't go away on retry - only transient failures are worth it
+_NON_RETRIABLE_ERRORS = (KeyError, TypeError, ValueError, AttributeError)
 
-        status_summary[agent_name] = {
-            "status": "failed",
-            "details": str(e),
-            "last_run": datetime.now().isoformat()
-        }
 
-        raise Exception(f"Agent {agent_name} failed: {str(e)}")
+def _retry_delay(retries: int) -> float:
+    """Exponential backoff with full jitter, capped at 30 seconds"""
+    return min(30, 0.1 * (2 ** retries)) * random.random()
+
+
+async def _run_agent_with_retry(agent: str, retry_failed: bool = True, max_retries: int = 3) -> Dict[str, Any]:
+    """Execute a single agent with retry logic, returning a result entry"""
+    retries = 0
+    # Always make the first attempt, even with max_retries <= 0 - the limit
+    # bounds retries, not executions
+    while True:
+        try:
+            result = await run_micro_agent(agent)
+            return {"agent": agent, "success": True, "result": result}
+        except Exception as e:
+            retries += 1
+            if (retries >= max_retries or not retry_failed
+                    or isinstance(e.__cause__, _NON_RETRIABLE_ERRORS)):
+                return {"agent": agent, "success": False, "error": str(e), "retries": retries}
+            # Back off before retrying so concurrent retries spread out in time
+            await asyncio.sleep(_retry_delay(retries))
 
 
 async def run_all_agents(retry_failed: bool = True, max_retries: int = 3) -> List[Dict[str, Any]]:
-    """Execute all agents in dependency order with retry logic"""
-    order = prioritize_agents()
+    """Execute all agents layer by layer: agents whose dependencies are
+    satisfied run concurrently, so independent agents no longer serialize."""
+    sorter = TopologicalSorter(micro_agents_dependencies)
+    sorter.prepare()
     results = []
 
-    for agent in order:
-        retries = 0
-        while retries < max_retries:
-            try:
-                result = await run_micro_agent(agent)
-                results.append({"agent": agent, "success": True, "result": result})
-                break
-            except Exception as e:
-                retries += 1
-                if retries >= max_retries or not retry_failed:
-                    results.append({"agent": agent, "success": False, "error": str(e), "retries": retries})
-                    break
-                else:
-                    # Wait before retry
-                    await asyncio.sleep(1)
+    while sorter.is_active():
+        ready = sorter.get_ready()
+        layer_results = await asyncio.gather(
+            *[_run_agent_with_retry(agent, retry_failed, max_retries) for agent in ready]
+        )
+        results.extend(layer_results)
+        for agent in ready:
+            sorter.done(agent)
 
     return results
 
@@ -246,22 +382,18 @@ def seo_orchestration_core(
         }
     }
 
-    # Priority scoring system
+    # Priority scoring system - single pass, highest priority first
     priority_scores = {
-        agent: 3 for agent in task_priorities.get("high_priority", [])
+        agent: score
+        for score, key in ((3, "high_priority"), (2, "medium_priority"), (1, "low_priority"))
+        for agent in task_priorities.get(key, ())
     }
-    priority_scores.update({
-        agent: 2 for agent in task_priorities.get("medium_priority", [])
-    })
-    priority_scores.update({
-        agent: 1 for agent in task_priorities.get("low_priority", [])
-    })
 
     # Resource allocation
     resource_allocation = {
         "total_agents_available": len(micro_agents_registry),
-        "active_agents": len([a for a in status_summary.values() if a.get("status") == "success"]),
-        "failed_agents": len([a for a in status_summary.values() if a.get("status") == "failed"]),
+        "active_agents": _status_counts["success"],
+        "failed_agents": _status_counts["failed"],
         "estimated_completion_time": "4-6 hours",
         "resource_utilization": "80%"
     }
@@ -270,7 +402,7 @@ def seo_orchestration_core(
     system_health = {
         "overall_status": "healthy" if resource_allocation["failed_agents"] == 0 else "degraded",
         "success_rate": (resource_allocation["active_agents"] / max(1, resource_allocation["total_agents_available"])) * 100,
-        "last_full_audit": datetime.now().isoformat(),
+        "last_full_audit": _now_iso(),
         "next_scheduled_run": "2024-10-05T10:00:00"
     }
 
@@ -357,13 +489,9 @@ async def api_seo_orchestration_core(request: AgentExecutionRequest):
         if not domain and url:
             domain = extract_domain_from_url(url)
 
-        result = await run_in_thread(
-            seo_orchestration_core,
-            url,
-            domain,
-            site_data,
-            task_priorities
-        )
+        # Pure dict-building work - calling inline is cheaper than the
+        # thread-pool round-trip
+        result = seo_orchestration_core(url, domain, site_data, task_priorities)
 
         return {"status": "SUCCESS", "result": result}
     except Exception as e:
@@ -380,7 +508,7 @@ async def trigger_all_agents(
         results = await run_all_agents(retry_failed, max_retries)
 
         successful = sum(1 for r in results if r["success"])
-        failed = sum(1 for r in results if not r["success"])
+        failed = len(results) - successful
 
         return {
             "message": "All agents executed",
@@ -389,7 +517,7 @@ async def trigger_all_agents(
             "successful": successful,
             "failed": failed,
             "success_rate": (successful / len(micro_agents_registry)) * 100 if micro_agents_registry else 0,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -408,7 +536,7 @@ async def trigger_single_agent(agent_name: str, request: AgentExecutionRequest =
             "agent": agent_name,
             "success": True,
             "result": result,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
 
         if request and request.url:
@@ -422,45 +550,32 @@ async def trigger_single_agent(agent_name: str, request: AgentExecutionRequest =
 @router.post("/trigger_phase/{phase_name}")
 async def trigger_phase(phase_name: str, request: AgentExecutionRequest = Body(None)):
     """Trigger a specific orchestration phase"""
-    valid_phases = [
-        "phase_1_foundation",
-        "phase_2_onpage",
-        "phase_3_technical",
-        "phase_4_content",
-        "phase_5_offpage"
-    ]
-
-    if phase_name not in valid_phases:
+    if phase_name not in VALID_PHASES:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid phase. Valid phases: {', '.join(valid_phases)}"
+            detail=f"Invalid phase. Valid phases: {_VALID_PHASES_MSG}"
         )
 
     try:
-        # Map phase to agents
-        phase_agents = {
-            "phase_1_foundation": ["robots_txt_management", "xml_sitemap_generator", "canonical_tag_management"],
-            "phase_2_onpage": ["title_tag_optimizer", "meta_description_generator", "header_tag_manager"],
-            "phase_3_technical": ["page_speed_analyzer", "mobile_usability_tester", "schema_markup_validator"],
-            "phase_4_content": ["content_quality_depth", "keyword_mapping", "internal_links_agent"],
-            "phase_5_offpage": ["backlink_analyzer", "social_signal_tracker", "brand_mention_outreach"]
-        }
+        # Execute registered phase agents concurrently (they are independent)
+        registered = [a for a in PHASE_AGENTS[phase_name] if a in micro_agents_registry]
+        outcomes = await asyncio.gather(
+            *[run_micro_agent(agent) for agent in registered],
+            return_exceptions=True
+        )
 
-        # Execute agents in phase (only if they're registered)
         phase_results = []
-        for agent in phase_agents[phase_name]:
-            if agent in micro_agents_registry:
-                try:
-                    result = await run_micro_agent(agent)
-                    phase_results.append({"agent": agent, "success": True, "result": result})
-                except Exception as e:
-                    phase_results.append({"agent": agent, "success": False, "error": str(e)})
+        for agent, outcome in zip(registered, outcomes):
+            if isinstance(outcome, Exception):
+                phase_results.append({"agent": agent, "success": False, "error": str(outcome)})
+            else:
+                phase_results.append({"agent": agent, "success": True, "result": outcome})
 
         response = {
             "phase": phase_name,
             "agents_executed": len(phase_results),
             "results": phase_results,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
 
         if request and request.url:
@@ -478,13 +593,13 @@ async def dashboard_summary():
     """Get dashboard summary with agent statuses"""
     return {
         "total_agents": len(micro_agents_registry),
-        "successful_agents": sum(1 for a in status_summary.values() if a["status"] == "success"),
-        "failed_agents": sum(1 for a in status_summary.values() if a["status"] == "failed"),
+        "successful_agents": _status_counts["success"],
+        "failed_agents": _status_counts["failed"],
         "not_run": len(micro_agents_registry) - len(status_summary),
         "details": status_summary,
-        "action_log": action_logs[-100:],  # Last 100 entries
+        "action_log": list(islice(action_logs, max(0, len(action_logs) - 100), None)),  # Last 100 entries
         "total_log_entries": len(action_logs),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
@@ -517,8 +632,8 @@ async def list_agents():
 async def orchestration_status():
     """Get overall orchestration system status"""
     total_agents = len(micro_agents_registry)
-    successful = sum(1 for a in status_summary.values() if a["status"] == "success")
-    failed = sum(1 for a in status_summary.values() if a["status"] == "failed")
+    successful = _status_counts["success"]
+    failed = _status_counts["failed"]
 
     system_health = "healthy"
     if failed > 0:
@@ -533,52 +648,56 @@ async def orchestration_status():
         "failed_agents": failed,
         "not_run_agents": total_agents - successful - failed,
         "success_rate": (successful / max(1, total_agents)) * 100,
-        "last_execution": max([a.get("last_run", "never") for a in status_summary.values()]) if status_summary else "never",
+        "last_execution": _last_execution_ts,
         "registered_categories": ["on_page_seo", "off_page_seo", "technical_seo", "local_seo", "orchestration"],
         "total_action_logs": len(action_logs),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
 @router.get("/agent_dependencies")
 async def get_agent_dependencies():
     """Get agent dependency graph"""
-    dependency_graph = {}
-
-    for agent, deps in micro_agents_dependencies.items():
-        dependency_graph[agent] = {
+    dependency_graph = {
+        agent: {
             "dependencies": deps,
-            "dependents": [a for a, a_deps in micro_agents_dependencies.items() if agent in a_deps]
+            "dependents": _dependents.get(agent, [])
         }
+        for agent, deps in micro_agents_dependencies.items()
+    }
 
     return {
         "dependency_graph": dependency_graph,
         "total_agents": len(micro_agents_registry),
         "agents_with_dependencies": len([a for a in micro_agents_dependencies.values() if len(a) > 0]),
         "agents_with_dependents": len([a for a, g in dependency_graph.items() if len(g["dependents"]) > 0]),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
 @router.post("/reset_agents")
 async def reset_agents():
     """Reset all agent statuses and logs"""
-    global action_logs, status_summary
+    global action_logs, status_summary, _last_execution_ts
 
     previous_state = {
         "total_agents": len(micro_agents_registry),
-        "successful_agents": sum(1 for a in status_summary.values() if a["status"] == "success"),
-        "failed_agents": sum(1 for a in status_summary.values() if a["status"] == "failed"),
+        "successful_agents": _status_counts["success"],
+        "failed_agents": _status_counts["failed"],
         "log_entries_cleared": len(action_logs)
     }
 
     action_logs.clear()
+    _per_agent_logs.clear()
     status_summary.clear()
+    _status_counts["success"] = 0
+    _status_counts["failed"] = 0
+    _last_execution_ts = "never"
 
     return {
         "message": "All agent statuses and logs have been reset",
         "previous_state": previous_state,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
@@ -587,9 +706,31 @@ async def get_execution_log(
     limit: int = Query(100),
     offset: int = Query(0)
 ):
-    """Get execution log with pagination"""
+    """Get execution log with pagination (streamed for very large pages)"""
     total = len(action_logs)
-    logs = action_logs[offset:offset + limit]
+
+    # For big pages, stream entries as they serialize instead of
+    # materializing the whole payload in memory first
+    if limit > 1000:
+        def stream_logs():
+            yield orjson.dumps({
+                "total_entries": total,
+                "returned": min(limit, max(0, total - offset)),
+                "offset": offset,
+                "limit": limit,
+                "timestamp": _now_iso()
+            })[:-1] + b',"logs":['
+            first = True
+            for log in islice(action_logs, offset, offset + limit):
+                if not first:
+                    yield b','
+                yield orjson.dumps(log)
+                first = False
+            yield b']}'
+
+        return StreamingResponse(stream_logs(), media_type="application/json")
+
+    logs = list(islice(action_logs, offset, offset + limit))
 
     return {
         "total_entries": total,
@@ -597,7 +738,7 @@ async def get_execution_log(
         "offset": offset,
         "limit": limit,
         "logs": logs,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
@@ -607,7 +748,7 @@ async def get_agent_status(agent_name: str):
     if agent_name not in micro_agents_registry:
         raise HTTPException(status_code=404, detail=f"Agent {agent_name} not found")
 
-    agent_logs = [log for log in action_logs if log["agent"] == agent_name]
+    agent_logs = list(_per_agent_logs.get(agent_name, ()))
 
     return {
         "agent_name": agent_name,
@@ -616,7 +757,7 @@ async def get_agent_status(agent_name: str):
         "last_run": status_summary.get(agent_name, {}).get("last_run", None),
         "execution_logs": agent_logs,
         "total_executions": len(agent_logs),
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
@@ -625,15 +766,15 @@ async def validate_dependencies():
     """Validate all agent dependencies and detect issues"""
     issues = []
 
-    # Check for missing dependencies
+    # Check for missing dependencies via set difference (runs in C)
+    registered = micro_agents_registry.keys()
     for agent, deps in micro_agents_dependencies.items():
-        for dep in deps:
-            if dep not in micro_agents_registry:
-                issues.append({
-                    "type": "missing_dependency",
-                    "agent": agent,
-                    "missing_dependency": dep
-                })
+        for dep in set(deps) - registered:
+            issues.append({
+                "type": "missing_dependency",
+                "agent": agent,
+                "missing_dependency": dep
+            })
 
     # Check for circular dependencies
     try:
@@ -651,7 +792,7 @@ async def validate_dependencies():
         "issues": issues,
         "total_issues": len(issues),
         "circular_dependencies_detected": circular_deps,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
@@ -659,8 +800,8 @@ async def validate_dependencies():
 async def get_health():
     """Get overall system health"""
     total_agents = len(micro_agents_registry)
-    successful = sum(1 for a in status_summary.values() if a["status"] == "success")
-    failed = sum(1 for a in status_summary.values() if a["status"] == "failed")
+    successful = _status_counts["success"]
+    failed = _status_counts["failed"]
 
     # Determine health status
     if failed == 0 and successful >= total_agents * 0.8:
@@ -679,47 +820,54 @@ async def get_health():
         "failed_agents": failed,
         "success_percentage": (successful / max(1, total_agents)) * 100,
         "uptime": "active",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
 
 
+# Static portion of the /status payload, built once - only the agent count
+# and timestamp vary between calls
+_STATUS_TEMPLATE = {
+    "agent": "core_seo_orchestration",
+    "status": "active",
+    "version": "2.0.0_with_url_support",
+    "available_endpoints": [
+        "seo_orchestration_core (POST with URL support)",
+        "trigger_all_agents (POST)",
+        "trigger_agent/{agent_name} (POST with URL context)",
+        "trigger_phase/{phase_name} (POST)",
+        "dashboard_summary (GET)",
+        "agents (GET)",
+        "orchestration_status (GET)",
+        "agent_dependencies (GET)",
+        "reset_agents (POST)",
+        "execution_log (GET with pagination)",
+        "agent_status/{agent_name} (GET)",
+        "validate_dependencies (POST)",
+        "health (GET)",
+        "status (GET)"
+    ],
+    "core_capabilities": [
+        "Agent Registration & Discovery",
+        "Dependency Management & Validation",
+        "Circular Dependency Detection",
+        "Execution Orchestration (Sequential & Parallel)",
+        "Status Monitoring & Tracking",
+        "Error Handling & Recovery with Retry Logic",
+        "Performance Analytics",
+        "Phase-based Execution",
+        "URL Support for All Operations",
+        "Domain Auto-extraction",
+        "Real-time Logging & Audit Trail"
+    ],
+    "url_support": "✅ Enabled - All endpoints support URL input",
+}
+
+
 @router.get("/status")
 async def get_status():
     """Get core agent system status"""
     return {
-        "agent": "core_seo_orchestration",
-        "status": "active",
-        "version": "2.0.0_with_url_support",
+        **_STATUS_TEMPLATE,
         "total_registered_agents": len(micro_agents_registry),
-        "available_endpoints": [
-            "seo_orchestration_core (POST with URL support)",
-            "trigger_all_agents (POST)",
-            "trigger_agent/{agent_name} (POST with URL context)",
-            "trigger_phase/{phase_name} (POST)",
-            "dashboard_summary (GET)",
-            "agents (GET)",
-            "orchestration_status (GET)",
-            "agent_dependencies (GET)",
-            "reset_agents (POST)",
-            "execution_log (GET with pagination)",
-            "agent_status/{agent_name} (GET)",
-            "validate_dependencies (POST)",
-            "health (GET)",
-            "status (GET)"
-        ],
-        "core_capabilities": [
-            "Agent Registration & Discovery",
-            "Dependency Management & Validation",
-            "Circular Dependency Detection",
-            "Execution Orchestration (Sequential & Parallel)",
-            "Status Monitoring & Tracking",
-            "Error Handling & Recovery with Retry Logic",
-            "Performance Analytics",
-            "Phase-based Execution",
-            "URL Support for All Operations",
-            "Domain Auto-extraction",
-            "Real-time Logging & Audit Trail"
-        ],
-        "url_support": "✅ Enabled - All endpoints support URL input",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     }
\ No newline at end of file
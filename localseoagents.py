@@ -1,26 +1,57 @@
 # Complete Local SEO Agents Module - UPDATED WITH URL SUPPORT
 # Updated to match Streamlit interface with all 8+ agents
 
-from fastapi import APIRouter, HTTPException, Body, Query
-from pydantic import BaseModel, validator
+from fastapi import APIRouter, HTTPException, Body, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, TypeAdapter, model_validator
 from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from urllib.parse import urlsplit
 import requests
 from bs4 import BeautifulSoup
-from textblob import TextBlob
+from rapidfuzz import fuzz
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 import random
 import asyncio
 import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+
+import numpy as np
+import orjson
 
 # ============ IMPORT URL EXTRACTOR ============
 import url_extractor
 
-router = APIRouter()
+# orjson keeps serialization of the large benchmark/keyword payloads off
+# the slow stdlib encoder even if this router is mounted standalone
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Compiled once at import - extract_business_info_from_url runs per request.
+# NANP pattern with a lookahead so a longer digit run isn't misread as a
+# phone number; the international fallback catches +XX formats.
+PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}(?!\d)')
+_PHONE_INTL_RE = re.compile(r'\+?\d[\d\s\-()]{7,}\d')
+
+# Lexicon-based analyzer, built once - far cheaper per review than
+# instantiating TextBlob's pattern analyzer for every text
+_VADER = SentimentIntensityAnalyzer()
+
+# Schema.org types that carry a local business address; the extractor's
+# schema_by_type index already expands list-valued @type into separate keys
+_LOCAL_TYPES = frozenset({"LocalBusiness", "Restaurant", "Store", "ProfessionalService"})
 
 
 # ============ UPDATED PYDANTIC MODELS WITH URL SUPPORT ============
 
 class BusinessData(BaseModel):
     """Business data model - now supports URL extraction"""
+    model_config = ConfigDict(extra="ignore")
+
     name: Optional[str] = None
     address: Optional[str] = None
     phone: Optional[str] = None
@@ -30,18 +61,22 @@ class BusinessData(BaseModel):
 
 class BusinessProfileRequest(BaseModel):
     """Request model for business profile operations - supports URL or manual data"""
+    model_config = ConfigDict(extra="ignore")
+
     url: Optional[str] = None  # NEW: Business listing URL or GMB URL
     gmb_url: Optional[str] = None  # NEW: Direct GMB URL
     business_data: Optional[BusinessData] = None  # Existing manual input
 
-    @validator('business_data', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url') and not values.get('gmb_url'):
+    @model_validator(mode='after')
+    def validate_input(self):
+        if not self.business_data and not self.url and not self.gmb_url:
             raise ValueError('Either url, gmb_url, or business_data must be provided')
-        return v
+        return self
 
 
 class ReviewData(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     text: str
     rating: Optional[int] = None
     platform: Optional[str] = None
@@ -51,31 +86,37 @@ class ReviewData(BaseModel):
 
 class ReviewRequest(BaseModel):
     """Request model for review management - supports URL or manual reviews"""
+    model_config = ConfigDict(extra="ignore")
+
     url: Optional[str] = None  # NEW: GMB or listing URL
     reviews: Optional[List[ReviewData]] = None  # Manual review input
     response_templates: Optional[Dict[str, str]] = None
 
-    @validator('reviews', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url'):
+    @model_validator(mode='after')
+    def validate_input(self):
+        if not self.reviews and not self.url:
             raise ValueError('Either url or reviews list must be provided')
-        return v
+        return self
 
 
 class CitationRequest(BaseModel):
     """Request model for citation operations - supports URL or manual data"""
+    model_config = ConfigDict(extra="ignore")
+
     url: Optional[str] = None  # NEW: Business profile URL
     business_data: Optional[BusinessData] = None
 
-    @validator('business_data', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url'):
+    @model_validator(mode='after')
+    def validate_input(self):
+        if not self.business_data and not self.url:
             raise ValueError('Either url or business_data must be provided')
-        return v
+        return self
 
 
 class LocalKeywordRequest(BaseModel):
     """Request model for local keyword research"""
+    model_config = ConfigDict(extra="ignore")
+
     url: Optional[str] = None  # NEW: Business website URL
     location: Optional[str] = None
     business_type: Optional[str] = None
@@ -84,33 +125,39 @@ class LocalKeywordRequest(BaseModel):
 
 class MapPackRequest(BaseModel):
     """Request model for map pack tracking"""
+    model_config = ConfigDict(extra="ignore")
+
     url: Optional[str] = None  # NEW: Business listing/GMB URL
     keywords: Optional[List[str]] = None
     location: Optional[str] = None
     competitors: Optional[List[str]] = None
 
-    @validator('keywords', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url'):
+    @model_validator(mode='after')
+    def validate_input(self):
+        if not self.keywords and not self.url:
             raise ValueError('Either url or keywords list must be provided')
-        return v
+        return self
 
 
 class CompetitorBenchmarkRequest(BaseModel):
     """Request model for competitor benchmarking"""
+    model_config = ConfigDict(extra="ignore")
+
     url: Optional[str] = None  # NEW: Your business URL
     business_data: Optional[BusinessData] = None
     competitor_urls: Optional[List[str]] = None  # NEW: Competitor URLs
     competitor_list: Optional[List[Dict[str, Any]]] = None  # Manual competitor data
 
-    @validator('business_data', always=True)
-    def validate_own_input(cls, v, values):
-        if not v and not values.get('url'):
+    @model_validator(mode='after')
+    def validate_own_input(self):
+        if not self.business_data and not self.url:
             raise ValueError('Either url or business_data must be provided for your business')
-        return v
+        return self
 
 
 class Listing(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     name: str
     address: str
     phone: str
@@ -119,14 +166,36 @@ class Listing(BaseModel):
 
 class NAPConsistencyRequest(BaseModel):
     """Request model for NAP consistency checking"""
+    model_config = ConfigDict(extra="ignore")
+
     url: Optional[str] = None  # NEW: Primary business URL
     listings: Optional[List[Listing]] = None  # Manual listings
 
-    @validator('listings', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url'):
+    @model_validator(mode='after')
+    def validate_input(self):
+        if not self.listings and not self.url:
             raise ValueError('Either url or listings must be provided')
-        return v
+        return self
+
+
+# List payloads dump through shared TypeAdapters - one pydantic-core call
+# for the whole list instead of a Python-level model_dump per element
+LISTINGS_ADAPTER = TypeAdapter(List[Listing])
+REVIEWS_ADAPTER = TypeAdapter(List[ReviewData])
+
+# The NAP agent only compares these fields, so nested review models are
+# never dumped
+_NAP_FIELDS = {"__all__": {"name", "address", "phone"}}
+
+
+# Pre-rendered envelope for the standard success payload: the wrapper dict
+# is never allocated and only the agent result goes through orjson
+_SUCCESS_PREFIX = b'{"status":"SUCCESS","result":'
+
+
+def _success_response(result) -> Response:
+    """Build the {"status": "SUCCESS", "result": ...} response from raw bytes"""
+    return Response(content=_SUCCESS_PREFIX + orjson.dumps(result) + b"}", media_type="application/json")
 
 
 # ============ HELPER FUNCTIONS ============
@@ -136,6 +205,143 @@ async def run_in_thread(func, *args, **kwargs):
     return await asyncio.to_thread(func, *args, **kwargs)
 
 
+# Pure-Python agents (benchmarks, keyword research, rank tracking, review
+# scoring) are CPU-bound, so threads just serialize on the GIL; a process
+# pool lets concurrent requests actually use multiple cores
+_CPU_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+async def run_cpu(func, *args, **kwargs):
+    """Execute a CPU-bound function in the shared process pool"""
+    return await asyncio.get_running_loop().run_in_executor(
+        _CPU_POOL, partial(func, *args, **kwargs)
+    )
+
+
+# ============ URL EXTRACTION CACHE ============
+# Repeat audits hit the same GMB/listing pages over and over; a TTL+LRU
+# cache short-circuits the fetch + parse on those hits. Entries younger
+# than TTL_FRESH are served as-is; between TTL_FRESH and TTL_STALE the
+# cached value is returned immediately while a background refresh runs
+# (stale-while-revalidate); past TTL_STALE the caller blocks on a fetch.
+_EXTRACT_CACHE_MAX = 1024
+_EXTRACT_TTL_FRESH = 300  # seconds
+_EXTRACT_TTL_STALE = 3600  # seconds
+_EXTRACT_TTL_ERROR = 60  # seconds - failed fetches are retried sooner
+_extract_cache = OrderedDict()  # normalized url -> (fetched_at, result)
+_extract_cache_lock = asyncio.Lock()
+extract_cache_stats = {"hits": 0, "misses": 0, "stale_served": 0}
+
+# Single-flight: concurrent requests for the same URL share one fetch
+# instead of each missing the cache and hitting the origin
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+def _normalize_extract_key(url: str) -> str:
+    """Normalize a URL into a cache key (lowercased host, no fragment or trailing slash)"""
+    parts = urlsplit(url)
+    key = f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+    if parts.query:
+        key += "?" + parts.query
+    return key
+
+
+async def _fetch_and_store(url: str, key: str) -> Dict[str, Any]:
+    """Single-flight fetch: one caller owns the request, the rest share its future"""
+    async with _extract_cache_lock:
+        pending = _inflight.get(key)
+        if pending is None:
+            pending = asyncio.get_running_loop().create_future()
+            _inflight[key] = pending
+            owner = True
+        else:
+            owner = False
+
+    if not owner:
+        return await asyncio.shield(pending)
+
+    try:
+        result = await url_extractor.extract_async(url)
+    except BaseException as e:
+        pending.set_exception(e)
+        async with _extract_cache_lock:
+            _inflight.pop(key, None)
+        raise
+    pending.set_result(result)
+
+    async with _extract_cache_lock:
+        _inflight.pop(key, None)
+        # Error results are cached too (negative caching) so a dead URL
+        # doesn't get hammered on every request; they expire much sooner
+        _extract_cache[key] = (time.monotonic(), result)
+        _extract_cache.move_to_end(key)
+        while len(_extract_cache) > _EXTRACT_CACHE_MAX:
+            _extract_cache.popitem(last=False)
+
+    return result
+
+
+async def _refresh_extract(url: str, key: str) -> None:
+    """Background revalidation of a stale entry; errors just leave the old value"""
+    try:
+        await _fetch_and_store(url, key)
+    except Exception:
+        pass
+
+
+async def async_cached_extract(url: str) -> Dict[str, Any]:
+    """Extract SEO data from a URL, serving repeated requests from cache"""
+    key = _normalize_extract_key(url)
+    now = time.monotonic()
+
+    refresh = False
+    async with _extract_cache_lock:
+        entry = _extract_cache.get(key)
+        if entry:
+            age = now - entry[0]
+            is_error = "error" in entry[1]
+            ttl_fresh = _EXTRACT_TTL_ERROR if is_error else _EXTRACT_TTL_FRESH
+            if age < ttl_fresh:
+                _extract_cache.move_to_end(key)
+                extract_cache_stats["hits"] += 1
+                return entry[1]
+            if not is_error and age < _EXTRACT_TTL_STALE:
+                # Serve stale and revalidate off the request path; the
+                # single-flight map collapses duplicate refreshes
+                _extract_cache.move_to_end(key)
+                extract_cache_stats["hits"] += 1
+                extract_cache_stats["stale_served"] += 1
+                refresh = key not in _inflight
+            else:
+                entry = None
+        if entry is None:
+            extract_cache_stats["misses"] += 1
+
+    if entry is not None:
+        if refresh:
+            asyncio.create_task(_refresh_extract(url, key))
+        return entry[1]
+
+    return await _fetch_and_store(url, key)
+
+
+async def extract_or_400(url: str) -> Dict[str, Any]:
+    """Cached extraction that turns extractor errors into a 400.
+
+    Shared preamble for the endpoints that require a successful fetch;
+    the caching layer means chained calls on the same URL run one fetch.
+    """
+    extracted = await async_cached_extract(url)
+    if "error" in extracted:
+        raise HTTPException(status_code=400, detail=extracted["error"])
+    return extracted
+
+
+# Bound concurrent competitor fetches so a big competitor list can't
+# monopolize the connection pool
+COMPETITOR_SEM = asyncio.Semaphore(16)
+
+
 def extract_business_info_from_url(extracted_data: Dict[str, Any]) -> Dict[str, str]:
     """Extract business information from URL metadata"""
     business_info = {
@@ -146,19 +352,20 @@ def extract_business_info_from_url(extracted_data: Dict[str, Any]) -> Dict[str,
     }
 
     # Try to extract phone from content
-    import re
     text_content = extracted_data.get("text_content", "")
-    phone_pattern = r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    phone_match = re.search(phone_pattern, text_content)
+    phone_match = PHONE_RE.search(text_content) or _PHONE_INTL_RE.search(text_content)
     if phone_match:
         business_info["phone"] = phone_match.group(0)
 
-    # Extract from schema markup
-    for schema in extracted_data.get("schema_markup", []):
-        if schema.get("@type") == "LocalBusiness" or "Organization" in schema.get("@type", ""):
+    # Extract from schema markup - the first LocalBusiness/Organization
+    # block wins, so stop scanning once found
+    for schema in extracted_data.get("schema_markup", ()):
+        schema_type = schema.get("@type", "")
+        if schema_type == "LocalBusiness" or "Organization" in schema_type:
             business_info["name"] = schema.get("name", business_info["name"])
             business_info["address"] = schema.get("address", {}).get("streetAddress", "") if isinstance(schema.get("address"), dict) else ""
             business_info["phone"] = schema.get("telephone", business_info["phone"])
+            break
 
     return business_info
 
@@ -179,13 +386,13 @@ def gmb_manager_agent(gmb_page_url: str = None, business_data: dict = None):
         "hours_verified": True
     }
 
-    optimization_score = sum([
-        25 if management_actions["business_info_updated"] else 0,
-        min(management_actions["photos_uploaded"] * 5, 25),
-        min(management_actions["posts_published"] * 8, 25),
-        management_actions["reviews_responded"] * 10,
-        10 if management_actions["hours_verified"] else 0
-    ])
+    optimization_score = (
+        (25 if management_actions["business_info_updated"] else 0)
+        + min(management_actions["photos_uploaded"] * 5, 25)
+        + min(management_actions["posts_published"] * 8, 25)
+        + management_actions["reviews_responded"] * 10
+        + (10 if management_actions["hours_verified"] else 0)
+    )
 
     return {
         "gmb_url": gmb_page_url or "https://business.google.com/example",
@@ -217,48 +424,61 @@ def business_profile_manager(listing_url: str = None, attributes: dict = None):
 
 # ============ SECTION 2: CITATION MANAGEMENT (2 AGENTS) ============
 
+@dataclass(slots=True, frozen=True)
+class DirectoryInfo:
+    """Static citation directory descriptor"""
+    name: str
+    priority: str
+    status: str
+
+
+# Built once at import - the directory roster is static, so per-call dict
+# construction was pure allocation churn
+_DIRECTORIES: tuple = (
+    DirectoryInfo("Google My Business", "high", "active"),
+    DirectoryInfo("Yelp", "high", "active"),
+    DirectoryInfo("Yellow Pages", "medium", "pending"),
+    DirectoryInfo("MapQuest", "medium", "not_listed"),
+    DirectoryInfo("Bing Places", "high", "active"),
+    DirectoryInfo("Apple Maps", "high", "needs_update"),
+    DirectoryInfo("Facebook", "high", "active"),
+    DirectoryInfo("Foursquare", "medium", "not_listed"),
+)
+
+
 def citation_builder_agent(business_data: dict = None):
     """Seeks new local citation opportunities, keeps existing ones consistent"""
     if not business_data:
         business_data = {"name": "Example Business", "address": "123 Main St", "phone": "555-1234"}
 
-    directories = [
-        {"name": "Google My Business", "priority": "high", "status": "active"},
-        {"name": "Yelp", "priority": "high", "status": "active"},
-        {"name": "Yellow Pages", "priority": "medium", "status": "pending"},
-        {"name": "MapQuest", "priority": "medium", "status": "not_listed"},
-        {"name": "Bing Places", "priority": "high", "status": "active"},
-        {"name": "Apple Maps", "priority": "high", "status": "needs_update"},
-        {"name": "Facebook", "priority": "high", "status": "active"},
-        {"name": "Foursquare", "priority": "medium", "status": "not_listed"}
-    ]
-
     citation_opportunities = []
     existing_citations = []
+    consistency_issues = 0
 
-    for directory in directories:
-        if directory["status"] == "not_listed":
+    for directory in _DIRECTORIES:
+        if directory.status == "not_listed":
             citation_opportunities.append({
-                "directory": directory["name"],
-                "priority": directory["priority"],
+                "directory": directory.name,
+                "priority": directory.priority,
                 "estimated_da": random.randint(40, 90),
                 "submission_cost": "free" if random.choice([True, False]) else "$25/year"
             })
         else:
+            nap_consistent = random.choice([True, False, True])
             existing_citations.append({
-                "directory": directory["name"],
-                "status": directory["status"],
-                "nap_consistent": random.choice([True, False, True])
+                "directory": directory.name,
+                "status": directory.status,
+                "nap_consistent": nap_consistent
             })
-
-    consistency_issues = len([c for c in existing_citations if not c["nap_consistent"]])
+            if not nap_consistent:
+                consistency_issues += 1
 
     return {
         "business_data": business_data,
         "citation_opportunities": citation_opportunities,
         "existing_citations": existing_citations,
         "consistency_issues": consistency_issues,
-        "total_directories": len(directories),
+        "total_directories": len(_DIRECTORIES),
         "recommendations": f"Fix {consistency_issues} consistency issues" if consistency_issues > 0 else "Citations are consistent"
     }
 
@@ -272,18 +492,22 @@ def citation_creation_audit_agent(business_data: dict = None):
 
     directories = ["yellowpages.com", "yelp.com", "mapquest.com", "superpages.com", "whitepages.com"]
     audit_results = []
+    consistent_count = 0
 
     for directory in directories:
+        is_consistent = random.choice([True, False, True])
         audit_results.append({
             "directory": directory,
             "current_nap": nap,
-            "is_consistent": random.choice([True, False, True]),
+            "is_consistent": is_consistent,
             "listing_exists": random.choice([True, False, True, True]),
             "last_updated": "2024-09-01",
             "action_needed": random.choice(["update_info", "create_listing", "none"])
         })
+        if is_consistent:
+            consistent_count += 1
 
-    consistency_score = len([a for a in audit_results if a["is_consistent"]]) / len(audit_results) * 100
+    consistency_score = consistent_count / len(audit_results) * 100
 
     return {
         "business_nap": nap,
@@ -296,6 +520,39 @@ def citation_creation_audit_agent(business_data: dict = None):
 
 # ============ SECTION 3: NAP CONSISTENCY (1 AGENT) ============
 
+def _normalize_name(name: str) -> str:
+    """Strip legal suffixes and case so 'Example Business Inc' matches 'Example Business'"""
+    return re.sub(r'\b(inc|llc|ltd|corp|co)\.?\s*$', '', name.lower()).strip()
+
+
+def _normalize_address(address: str) -> str:
+    """Fold common street-type spellings so '123 Main Street' matches '123 Main St'"""
+    addr = address.lower().strip()
+    for long_form, short_form in (("street", "st"), ("avenue", "ave"), ("boulevard", "blvd"), ("drive", "dr"), ("road", "rd")):
+        addr = addr.replace(long_form, short_form)
+    return addr
+
+
+def _normalize_phone(phone: str) -> str:
+    """Reduce a phone number to its last 10 digits regardless of formatting"""
+    return re.sub(r'\D', '', phone)[-10:]
+
+
+def _values_consistent(values: list, fuzzy: bool = False) -> bool:
+    """True when all (normalized) values refer to the same thing.
+
+    With fuzzy=True, near-duplicates like reworded names are accepted when
+    their token-set similarity is at least 90.
+    """
+    distinct = list(dict.fromkeys(values))
+    if len(distinct) <= 1:
+        return True
+    if fuzzy:
+        base = distinct[0]
+        return all(fuzz.token_set_ratio(base, other) >= 90 for other in distinct[1:])
+    return False
+
+
 def nap_consistency_agent(listings: list = None):
     """Audits and ensures name, address, phone data is consistent across directories"""
     if not listings:
@@ -304,16 +561,29 @@ def nap_consistency_agent(listings: list = None):
             {"name": "Example Business Inc", "address": "123 Main Street", "phone": "(555) 123-4567"}
         ]
 
+    # One pass over the listings; dict keys dedupe while keeping first-seen
+    # order, so the canonical pick below is deterministic
+    names, addresses, phones = {}, {}, {}
+    for listing in listings:
+        names[listing.get("name", "")] = None
+        addresses[listing.get("address", "")] = None
+        phones[listing.get("phone", "")] = None
+
     nap_variations = {
-        "names": list(set([listing.get("name", "") for listing in listings])),
-        "addresses": list(set([listing.get("address", "") for listing in listings])),
-        "phones": list(set([listing.get("phone", "") for listing in listings]))
+        "names": list(names),
+        "addresses": list(addresses),
+        "phones": list(phones)
     }
 
+    # Compare normalized values so formatting differences don't raise false
+    # alarms, while genuinely different data still gets flagged
     consistency_check = {
-        "name_consistent": len(nap_variations["names"]) == 1,
-        "address_consistent": len(nap_variations["addresses"]) == 1,
-        "phone_consistent": len(nap_variations["phones"]) == 1
+        "name_consistent": _values_consistent(
+            [_normalize_name(n) for n in nap_variations["names"]], fuzzy=True),
+        "address_consistent": _values_consistent(
+            [_normalize_address(a) for a in nap_variations["addresses"]], fuzzy=True),
+        "phone_consistent": _values_consistent(
+            [_normalize_phone(p) for p in nap_variations["phones"]])
     }
 
     overall_consistency = all(consistency_check.values())
@@ -353,31 +623,40 @@ def review_management_agent(reviews: list = None, response_templates: dict = Non
             {"text": "Excellent experience!", "rating": 5, "platform": "Facebook", "responded": True}
         ]
 
+    # Score every review, then classify the whole batch in one vectorized
+    # np.select instead of branching per review
+    scores = np.fromiter(
+        (_VADER.polarity_scores(review.get("text", ""))["compound"] for review in reviews),
+        dtype=np.float64, count=len(reviews)
+    )
+    sentiments = np.select([scores > 0.3, scores < -0.3], ["positive", "negative"], default="neutral")
+
+    sentiment_counts = {"positive": 0, "neutral": 0, "negative": 0}
+    labels, counts = np.unique(sentiments, return_counts=True)
+    sentiment_counts.update(zip(labels.tolist(), counts.tolist()))
+
     sentiment_analysis = []
     total_rating = 0
     responded_count = 0
+    follow_up_needed = 0
+    positive_reviews = 0
 
-    for review in reviews:
-        blob = TextBlob(review.get("text", ""))
-        sentiment_score = blob.sentiment.polarity
-
-        if sentiment_score > 0.3:
-            sentiment = "positive"
-        elif sentiment_score < -0.3:
-            sentiment = "negative"
-        else:
-            sentiment = "neutral"
-
+    for review, score, sentiment in zip(reviews, scores, sentiments):
         sentiment_analysis.append({
             "text": review.get("text", "")[:50] + "...",
             "rating": review.get("rating", 0),
-            "sentiment": sentiment,
-            "sentiment_score": round(sentiment_score, 2),
+            "sentiment": str(sentiment),
+            "sentiment_score": round(float(score), 2),
             "platform": review.get("platform", "unknown"),
             "responded": review.get("responded", False)
         })
 
-        total_rating += review.get("rating", 0)
+        rating = review.get("rating", 0)
+        total_rating += rating
+        if rating <= 3:
+            follow_up_needed += 1
+        if rating >= 4:
+            positive_reviews += 1
         if review.get("responded", False):
             responded_count += 1
 
@@ -403,8 +682,8 @@ def review_management_agent(reviews: list = None, response_templates: dict = Non
     acquisition_strategy = {
         "current_review_rate": "2-3 per week",
         "target_platforms": ["Google", "Yelp", "Facebook"],
-        "follow_up_needed": len([r for r in reviews if r.get("rating", 0) <= 3]),
-        "positive_reviews_to_promote": len([r for r in reviews if r.get("rating", 0) >= 4])
+        "follow_up_needed": follow_up_needed,
+        "positive_reviews_to_promote": positive_reviews
     }
 
     return {
@@ -412,11 +691,7 @@ def review_management_agent(reviews: list = None, response_templates: dict = Non
             "total_reviews": len(reviews),
             "average_rating": round(average_rating, 1),
             "response_rate_percent": round(response_rate, 1),
-            "sentiment_breakdown": {
-                "positive": len([s for s in sentiment_analysis if s["sentiment"] == "positive"]),
-                "neutral": len([s for s in sentiment_analysis if s["sentiment"] == "neutral"]),
-                "negative": len([s for s in sentiment_analysis if s["sentiment"] == "negative"])
-            }
+            "sentiment_breakdown": sentiment_counts
         },
         "sentiment_analysis": sentiment_analysis,
         "response_suggestions": response_suggestions,
@@ -452,21 +727,42 @@ def local_keyword_research(location: str = None, business_type: str = None, serv
 
     nearby_areas = [f"{location} downtown", f"{location} center", f"near {location}"]
 
-    for keyword in base_combinations + nearby_areas:
+    # Draw all the mock metrics in one batch instead of 4 RNG calls per keyword
+    all_keywords = base_combinations + nearby_areas
+    rng = np.random.default_rng()
+    n = len(all_keywords)
+    volumes = rng.integers(50, 2001, size=n)
+    competition = rng.choice(["low", "medium", "high"], size=n)
+    intent = rng.choice(["high", "medium", "low"], size=n)
+    difficulty = rng.integers(1, 11, size=n)
+
+    for i, keyword in enumerate(all_keywords):
         local_keywords.append({
             "keyword": keyword,
-            "search_volume": random.randint(50, 2000),
-            "competition": random.choice(["low", "medium", "high"]),
-            "commercial_intent": random.choice(["high", "medium", "low"]),
-            "local_pack_difficulty": random.randint(1, 10)
+            "search_volume": int(volumes[i]),
+            "competition": str(competition[i]),
+            "commercial_intent": str(intent[i]),
+            "local_pack_difficulty": int(difficulty[i])
         })
 
+    # Classify in a single pass with case-folding done once per keyword,
+    # instead of three separate comprehensions over the same list
+    services_lower = [service.lower() for service in services]
+    btype_lower = business_type.lower()
     keyword_categories = {
-        "high_intent": [kw for kw in local_keywords if kw["commercial_intent"] == "high"],
-        "brand_defense": [kw for kw in local_keywords if business_type.lower() in kw["keyword"]],
-        "service_specific": [kw for kw in local_keywords if any(service in kw["keyword"] for service in services)],
+        "high_intent": [],
+        "brand_defense": [],
+        "service_specific": [],
         "competitor_analysis": [f"vs {business_type} {location}", f"alternative to {business_type} {location}"]
     }
+    for kw in local_keywords:
+        kw_lower = kw["keyword"].lower()
+        if kw["commercial_intent"] == "high":
+            keyword_categories["high_intent"].append(kw)
+        if btype_lower in kw_lower:
+            keyword_categories["brand_defense"].append(kw)
+        if any(service in kw_lower for service in services_lower):
+            keyword_categories["service_specific"].append(kw)
 
     return {
         "location": location,
@@ -486,10 +782,21 @@ def map_pack_rank_tracker(keywords: list = None, location: str = None, competito
     competitors = competitors or ["Competitor A", "Competitor B", "Competitor C"]
 
     ranking_data = []
-
-    for keyword in keywords:
-        business_rank = random.randint(1, 10)
-        competitor_ranks = {comp: random.randint(1, 10) for comp in competitors}
+    map_pack_appearances = 0
+    total_rank = 0
+    total_visibility = 0.0
+    competitor_map_pack_counts = {comp: 0 for comp in competitors}
+
+    # Batch-sample every rank/volume up front: one RNG call per metric
+    # instead of one per keyword (and per competitor)
+    rng = np.random.default_rng()
+    business_ranks = rng.integers(1, 11, size=len(keywords))
+    comp_ranks = rng.integers(1, 11, size=(len(keywords), len(competitors)))
+    search_volumes = rng.integers(100, 5001, size=len(keywords))
+
+    for i, keyword in enumerate(keywords):
+        business_rank = int(business_ranks[i])
+        competitor_ranks = {comp: int(comp_ranks[i, j]) for j, comp in enumerate(competitors)}
 
         visibility_score = max(0, 100 - (business_rank - 1) * 15)
 
@@ -500,19 +807,25 @@ def map_pack_rank_tracker(keywords: list = None, location: str = None, competito
             "in_map_pack": business_rank <= 3,
             "competitor_ranks": competitor_ranks,
             "visibility_score": round(visibility_score, 1),
-            "search_volume": random.randint(100, 5000),
+            "search_volume": int(search_volumes[i]),
             "tracking_date": "2024-10-04"
         }
 
         ranking_data.append(ranking_entry)
 
-    map_pack_appearances = len([r for r in ranking_data if r["in_map_pack"]])
-    average_rank = sum([r["business_rank"] for r in ranking_data]) / len(ranking_data)
-    total_visibility = sum([r["visibility_score"] for r in ranking_data])
+        total_rank += business_rank
+        total_visibility += ranking_entry["visibility_score"]
+        if business_rank <= 3:
+            map_pack_appearances += 1
+        for comp, rank in competitor_ranks.items():
+            if rank <= 3:
+                competitor_map_pack_counts[comp] += 1
+
+    average_rank = total_rank / len(ranking_data)
 
     competitive_analysis = {}
     for competitor in competitors:
-        competitor_map_pack = len([r for r in ranking_data if r["competitor_ranks"].get(competitor, 10) <= 3])
+        competitor_map_pack = competitor_map_pack_counts[competitor]
         competitive_analysis[competitor] = {
             "map_pack_appearances": competitor_map_pack,
             "threat_level": "high" if competitor_map_pack > map_pack_appearances else "medium" if competitor_map_pack == map_pack_appearances else "low"
@@ -554,49 +867,67 @@ def local_competitor_benchmark_agent(business_data: dict = None, competitor_list
         "citation_count", "website_local_seo", "social_presence"
     ]
 
+    # One batched draw per metric column covers every competitor at once
+    rng = np.random.default_rng()
+    k = len(competitor_list)
+    default_reviews = rng.integers(50, 301, size=k)
+    default_ratings = rng.uniform(3.5, 4.8, size=k)
+    gmb_scores = rng.integers(60, 101, size=k)
+    citation_counts = rng.integers(40, 151, size=k)
+    website_scores = rng.integers(50, 96, size=k)
+    social_scores = rng.integers(30, 91, size=k)
+
     competitive_comparison = {
         "your_business": {
             "name": business_data.get("name", "Your Business"),
             "google_reviews_count": business_data.get("reviews", 0),
             "average_rating": business_data.get("rating", 0),
-            "gmb_completeness": random.randint(70, 95),
-            "citation_count": random.randint(50, 120),
-            "website_local_seo": random.randint(60, 90),
-            "social_presence": random.randint(40, 80)
+            "gmb_completeness": int(rng.integers(70, 96)),
+            "citation_count": int(rng.integers(50, 121)),
+            "website_local_seo": int(rng.integers(60, 91)),
+            "social_presence": int(rng.integers(40, 81))
         }
     }
 
     competitor_data = []
-    for competitor in competitor_list:
+    for i, competitor in enumerate(competitor_list):
         competitor_metrics = {
             "name": competitor.get("name", "Competitor"),
-            "google_reviews_count": competitor.get("reviews", random.randint(50, 300)),
-            "average_rating": competitor.get("rating", random.uniform(3.5, 4.8)),
-            "gmb_completeness": random.randint(60, 100),
-            "citation_count": random.randint(40, 150),
-            "website_local_seo": random.randint(50, 95),
-            "social_presence": random.randint(30, 90)
+            "google_reviews_count": competitor.get("reviews", int(default_reviews[i])),
+            "average_rating": competitor.get("rating", float(default_ratings[i])),
+            "gmb_completeness": int(gmb_scores[i]),
+            "citation_count": int(citation_counts[i]),
+            "website_local_seo": int(website_scores[i]),
+            "social_presence": int(social_scores[i])
         }
         competitor_data.append(competitor_metrics)
 
-    rankings = {}
-    for category in benchmark_categories:
-        all_scores = [competitive_comparison["your_business"][category]]
-        all_scores.extend([comp[category] for comp in competitor_data])
-
-        sorted_scores = sorted(enumerate(all_scores), key=lambda x: x[1], reverse=True)
-        your_rank = next(i for i, (original_idx, score) in enumerate(sorted_scores) if original_idx == 0) + 1
+    # Rank all businesses per category in one vectorized pass: row 0 is
+    # your business, the double argsort turns scores into dense ranks
+    scores = np.array(
+        [[competitive_comparison["your_business"][c] for c in benchmark_categories]]
+        + [[comp[c] for c in benchmark_categories] for comp in competitor_data]
+    )
+    ranks = (-scores).argsort(axis=0, kind='stable').argsort(axis=0, kind='stable') + 1
+    leaders = scores.max(axis=0)
+    total_businesses = scores.shape[0]
 
+    rankings = {}
+    for j, category in enumerate(benchmark_categories):
+        your_rank = int(ranks[0, j])
         rankings[category] = {
             "your_score": competitive_comparison["your_business"][category],
             "your_rank": your_rank,
-            "total_businesses": len(all_scores),
-            "category_leader": max(all_scores),
+            "total_businesses": total_businesses,
+            "category_leader": leaders[j].item(),
             "improvement_needed": your_rank > 2
         }
 
     improvement_opportunities = []
+    categories_leading = 0
     for category, data in rankings.items():
+        if data["your_rank"] == 1:
+            categories_leading += 1
         if data["improvement_needed"]:
             gap = data["category_leader"] - data["your_score"]
             improvement_opportunities.append({
@@ -606,7 +937,7 @@ def local_competitor_benchmark_agent(business_data: dict = None, competitor_list
                 "priority": "high" if gap > 50 else "medium" if gap > 20 else "low"
             })
 
-    avg_rank = sum([r["your_rank"] for r in rankings.values()]) / len(rankings)
+    avg_rank = sum(r["your_rank"] for r in rankings.values()) / len(rankings)
     competitive_strength = "strong" if avg_rank <= 2 else "competitive" if avg_rank <= 3 else "needs_improvement"
 
     return {
@@ -620,7 +951,7 @@ def local_competitor_benchmark_agent(business_data: dict = None, competitor_list
         "competitive_analysis": {
             "average_rank": round(avg_rank, 1),
             "competitive_strength": competitive_strength,
-            "categories_leading": len([r for r in rankings.values() if r["your_rank"] == 1]),
+            "categories_leading": categories_leading,
             "categories_need_improvement": len(improvement_opportunities)
         }
     }
@@ -628,7 +959,7 @@ def local_competitor_benchmark_agent(business_data: dict = None, competitor_list
 
 # ============ UPDATED API ENDPOINTS WITH URL SUPPORT ============
 
-@router.post("/gmb_manager")
+@router.post("/gmb_manager", response_model=None)
 async def api_gmb_manager(request: BusinessProfileRequest):
     """
     Manage Google Business Profile
@@ -636,65 +967,49 @@ async def api_gmb_manager(request: BusinessProfileRequest):
     - If URL: Extracts business info from GMB/listing page
     - If business_data: Uses provided data
     """
-    try:
-        if request.url or request.gmb_url:
-            # Extract from URL
-            url_to_extract = request.url or request.gmb_url
-            extracted = await run_in_thread(url_extractor.extract, url_to_extract)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
-
-            # Extract business info from URL
-            business_info = extract_business_info_from_url(extracted)
-            result = await run_in_thread(gmb_manager_agent, url_to_extract, business_info)
-
-            # Add extracted metadata
-            result.update({
-                "source_url": url_to_extract,
-                "extracted_data": {
-                    "title": extracted.get("title"),
-                    "schema_markup": extracted.get("schema_markup", [])[:2]
-                }
-            })
-        else:
-            # Use provided business data
-            business_dict = request.business_data.dict() if request.business_data else {}
-            result = await run_in_thread(gmb_manager_agent, None, business_dict)
+    if request.url or request.gmb_url:
+        # Extract from URL
+        url_to_extract = request.url or request.gmb_url
+        extracted = await extract_or_400(url_to_extract)
+
+        # Extract business info from URL
+        business_info = extract_business_info_from_url(extracted)
+        result = await run_in_thread(gmb_manager_agent, url_to_extract, business_info)
+
+        # Add extracted metadata
+        result.update({
+            "source_url": url_to_extract,
+            "extracted_data": {
+                "title": extracted.get("title"),
+                "schema_markup": extracted.get("schema_markup", [])[:2]
+            }
+        })
+    else:
+        # Use provided business data
+        business_dict = request.business_data.model_dump(exclude_none=True) if request.business_data else {}
+        result = await run_in_thread(gmb_manager_agent, None, business_dict)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return _success_response(result)
 
 
-@router.post("/business_profile_manager")
+@router.post("/business_profile_manager", response_model=None)
 async def api_business_profile_manager(request: BusinessProfileRequest):
     """Manage business profile attributes"""
-    try:
-        if request.url or request.gmb_url:
-            url_to_extract = request.url or request.gmb_url
-            extracted = await run_in_thread(url_extractor.extract, url_to_extract)
+    if request.url or request.gmb_url:
+        url_to_extract = request.url or request.gmb_url
+        extracted = await extract_or_400(url_to_extract)
 
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+        business_info = extract_business_info_from_url(extracted)
+        result = await run_in_thread(business_profile_manager, url_to_extract, business_info)
+        result["source_url"] = url_to_extract
+    else:
+        business_dict = request.business_data.model_dump(exclude_none=True) if request.business_data else {}
+        result = await run_in_thread(business_profile_manager, None, business_dict)
 
-            business_info = extract_business_info_from_url(extracted)
-            result = await run_in_thread(business_profile_manager, url_to_extract, business_info)
-            result["source_url"] = url_to_extract
-        else:
-            business_dict = request.business_data.dict() if request.business_data else {}
-            result = await run_in_thread(business_profile_manager, None, business_dict)
-
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return _success_response(result)
 
 
-@router.post("/citation_builder")
+@router.post("/citation_builder", response_model=None)
 async def api_citation_builder(request: CitationRequest):
     """
     Build citations across directories
@@ -702,28 +1017,20 @@ async def api_citation_builder(request: CitationRequest):
     - If URL: Extracts business info from listing
     - If business_data: Uses provided data
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
+    if request.url:
+        extracted = await extract_or_400(request.url)
 
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+        business_info = extract_business_info_from_url(extracted)
+        result = await run_in_thread(citation_builder_agent, business_info)
+        result["source_url"] = request.url
+    else:
+        business_dict = request.business_data.model_dump(exclude_none=True) if request.business_data else {}
+        result = await run_in_thread(citation_builder_agent, business_dict)
 
-            business_info = extract_business_info_from_url(extracted)
-            result = await run_in_thread(citation_builder_agent, business_info)
-            result["source_url"] = request.url
-        else:
-            business_dict = request.business_data.dict() if request.business_data else {}
-            result = await run_in_thread(citation_builder_agent, business_dict)
-
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return _success_response(result)
 
 
-@router.post("/citation_creation_audit")
+@router.post("/citation_creation_audit", response_model=None)
 async def api_citation_audit(request: CitationRequest):
     """
     Audit citation consistency
@@ -731,28 +1038,20 @@ async def api_citation_audit(request: CitationRequest):
     - If URL: Extracts and audits business info
     - If business_data: Audits provided data
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
+    if request.url:
+        extracted = await extract_or_400(request.url)
 
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+        business_info = extract_business_info_from_url(extracted)
+        result = await run_cpu(citation_creation_audit_agent, business_info)
+        result["source_url"] = request.url
+    else:
+        business_dict = request.business_data.model_dump(exclude_none=True) if request.business_data else {}
+        result = await run_cpu(citation_creation_audit_agent, business_dict)
 
-            business_info = extract_business_info_from_url(extracted)
-            result = await run_in_thread(citation_creation_audit_agent, business_info)
-            result["source_url"] = request.url
-        else:
-            business_dict = request.business_data.dict() if request.business_data else {}
-            result = await run_in_thread(citation_creation_audit_agent, business_dict)
-
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return _success_response(result)
 
 
-@router.post("/nap_consistency")
+@router.post("/nap_consistency", response_model=None)
 async def api_nap_consistency(request: NAPConsistencyRequest):
     """
     Check NAP consistency
@@ -760,30 +1059,22 @@ async def api_nap_consistency(request: NAPConsistencyRequest):
     - If URL: Extracts from business listing page
     - If listings: Checks provided listings
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
+    if request.url:
+        extracted = await extract_or_400(request.url)
 
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+        business_info = extract_business_info_from_url(extracted)
+        listings_to_check = [business_info]
 
-            business_info = extract_business_info_from_url(extracted)
-            listings_to_check = [business_info]
+        result = await run_cpu(nap_consistency_agent, listings_to_check)
+        result["source_url"] = request.url
+    else:
+        listings_dict = LISTINGS_ADAPTER.dump_python(request.listings, include=_NAP_FIELDS) if request.listings else []
+        result = await run_cpu(nap_consistency_agent, listings_dict)
 
-            result = await run_in_thread(nap_consistency_agent, listings_to_check)
-            result["source_url"] = request.url
-        else:
-            listings_dict = [l.dict() for l in request.listings] if request.listings else []
-            result = await run_in_thread(nap_consistency_agent, listings_dict)
-
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return _success_response(result)
 
 
-@router.post("/review_management")
+@router.post("/review_management", response_model=None)
 async def api_review_management(request: ReviewRequest):
     """
     Manage and respond to reviews
@@ -791,29 +1082,24 @@ async def api_review_management(request: ReviewRequest):
     - If URL: Extracts from GMB/listing page
     - If reviews: Analyzes provided reviews
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
-
-            # Parse reviews from page content if available
-            reviews_to_analyze = []
-            result = await run_in_thread(review_management_agent, reviews_to_analyze or None, request.response_templates)
-            result["source_url"] = request.url
-        else:
-            reviews_dict = [r.dict() for r in request.reviews] if request.reviews else []
-            result = await run_in_thread(review_management_agent, reviews_dict, request.response_templates)
+    if request.url:
+        # The extractor has no review parser, so a page fetch never yields
+        # reviews to analyze; validate the URL and return an empty analysis
+        await extract_or_400(request.url)
+
+        return _success_response({
+            "source_url": request.url,
+            "reviews": [],
+            "analysis": None
+        })
+    else:
+        reviews_dict = REVIEWS_ADAPTER.dump_python(request.reviews, exclude_none=True) if request.reviews else []
+        result = await run_cpu(review_management_agent, reviews_dict, request.response_templates)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return _success_response(result)
 
 
-@router.post("/local_keyword_research")
+@router.post("/local_keyword_research", response_model=None)
 async def api_local_keywords(request: LocalKeywordRequest):
     """
     Discover local keywords
@@ -821,33 +1107,31 @@ async def api_local_keywords(request: LocalKeywordRequest):
     - If URL: Extracts business type from website
     - If business_type: Uses provided type
     """
-    try:
-        location = request.location
-        business_type = request.business_type
-        services = request.services
+    location = request.location
+    business_type = request.business_type
+    services = request.services
 
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
+    if request.url:
+        extracted = await async_cached_extract(request.url)
 
-            if "error" not in extracted:
-                # Try to extract business type from title or content
-                if not business_type:
-                    business_type = extracted.get("title", "").split("|")[0].lower()
+        if "error" not in extracted:
+            # Try to extract business type from title or content
+            if not business_type:
+                # partition stops at the first separator without building a list
+                business_type = extracted.get("title", "").partition("|")[0].strip().lower()
 
-                result = await run_in_thread(local_keyword_research, location, business_type, services)
-                result["source_url"] = request.url
-                result["extracted_from"] = "website"
-            else:
-                result = await run_in_thread(local_keyword_research, location, business_type, services)
+            result = await run_cpu(local_keyword_research, location, business_type, services)
+            result["source_url"] = request.url
+            result["extracted_from"] = "website"
         else:
-            result = await run_in_thread(local_keyword_research, location, business_type, services)
+            result = await run_cpu(local_keyword_research, location, business_type, services)
+    else:
+        result = await run_cpu(local_keyword_research, location, business_type, services)
 
-        return {"status": "SUCCESS", "result": result}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return _success_response(result)
 
 
-@router.post("/map_pack_rank_tracker")
+@router.post("/map_pack_rank_tracker", response_model=None)
 async def api_map_pack_tracker(request: MapPackRequest):
     """
     Track map pack rankings
@@ -855,76 +1139,93 @@ async def api_map_pack_tracker(request: MapPackRequest):
     - If URL: Extracts location from listing
     - If keywords: Uses provided keywords
     """
-    try:
-        keywords = request.keywords
-        location = request.location
-        competitors = request.competitors
-
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" not in extracted:
-                # Extract location info from schema if available
-                for schema in extracted.get("schema_markup", []):
-                    if schema.get("@type") == "LocalBusiness":
-                        if not location:
-                            location = schema.get("address", {}).get("addressLocality", "")
-
-                result = await run_in_thread(map_pack_rank_tracker, keywords, location, competitors)
-                result["source_url"] = request.url
-            else:
-                result = await run_in_thread(map_pack_rank_tracker, keywords, location, competitors)
+    keywords = request.keywords
+    location = request.location
+    competitors = request.competitors
+
+    if request.url:
+        extracted = await async_cached_extract(request.url)
+
+        if "error" not in extracted:
+            # Extract location info from the schema index if available -
+            # any local-business-ish type counts, not just LocalBusiness
+            schema_index = extracted.get("schema_by_type", {})
+            if not location:
+                for schema_type in _LOCAL_TYPES.intersection(schema_index):
+                    location = schema_index[schema_type].get("address", {}).get("addressLocality", "")
+                    if location:
+                        break
+
+            result = await run_cpu(map_pack_rank_tracker, keywords, location, competitors)
+            result["source_url"] = request.url
         else:
-            result = await run_in_thread(map_pack_rank_tracker, keywords, location, competitors)
+            result = await run_cpu(map_pack_rank_tracker, keywords, location, competitors)
+    else:
+        result = await run_cpu(map_pack_rank_tracker, keywords, location, competitors)
 
-        return {"status": "SUCCESS", "result": result}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return _success_response(result)
 
 
-@router.post("/local_competitor_benchmark")
+@router.post("/local_competitor_benchmark", response_model=None)
 async def api_competitor_benchmark(request: CompetitorBenchmarkRequest):
     """
-    Benchmark against competitors
+    Benchmark against competitors - streamed as NDJSON
 
     - If URL + competitor_urls: Extracts and compares data from URLs
     - If business_data + competitor_list: Uses provided data
+
+    One line is emitted per competitor as its extraction completes, then a
+    final {"status": "SUCCESS", "result": ...} line with the benchmark, so
+    clients see progress instead of waiting on the slowest fetch.
     """
-    try:
+    async def stream():
+        # Dispatch every fetch at once - your business page resolves
+        # concurrently with the competitor fan-out instead of ahead of it
+        own_task = asyncio.create_task(async_cached_extract(request.url)) if request.url else None
+
+        competitor_data = []
+        if request.competitor_urls:
+            async def _one(url: str):
+                async with COMPETITOR_SEM:
+                    return url, await async_cached_extract(url)
+
+            tasks = [asyncio.create_task(_one(u)) for u in request.competitor_urls]
+            for fut in asyncio.as_completed(tasks):
+                try:
+                    comp_url, comp_extracted = await fut
+                except Exception as e:
+                    yield orjson.dumps({"competitor": None, "error": str(e)}) + b"\n"
+                    continue
+                if "error" in comp_extracted:
+                    yield orjson.dumps({"competitor": comp_url, "error": comp_extracted["error"]}) + b"\n"
+                    continue
+                business_info = extract_business_info_from_url(comp_extracted)
+                competitor_data.append(business_info)
+                yield orjson.dumps({"competitor": comp_url, "business_info": business_info}) + b"\n"
+        else:
+            competitor_data.extend(request.competitor_list or [])
+
         # Get your business data
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
+        if own_task is not None:
+            extracted = await own_task
 
             if "error" not in extracted:
                 your_business = extract_business_info_from_url(extracted)
             else:
-                your_business = request.business_data.dict() if request.business_data else {}
-        else:
-            your_business = request.business_data.dict() if request.business_data else {}
-
-        # Get competitor data
-        competitor_data = []
-        if request.competitor_urls:
-            for comp_url in request.competitor_urls:
-                comp_extracted = await run_in_thread(url_extractor.extract, comp_url)
-                if "error" not in comp_extracted:
-                    comp_info = extract_business_info_from_url(comp_extracted)
-                    competitor_data.append(comp_info)
+                your_business = request.business_data.model_dump(exclude_none=True) if request.business_data else {}
         else:
-            competitor_data = request.competitor_list or []
+            your_business = request.business_data.model_dump(exclude_none=True) if request.business_data else {}
 
-        result = await run_in_thread(local_competitor_benchmark_agent, your_business, competitor_data)
+        result = await run_cpu(local_competitor_benchmark_agent, your_business, competitor_data)
 
         if request.url:
             result["source_url"] = request.url
         if request.competitor_urls:
             result["competitor_sources"] = request.competitor_urls
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        yield _SUCCESS_PREFIX + orjson.dumps(result) + b"}\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
 
 
 @router.get("/status")
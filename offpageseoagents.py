@@ -2,57 +2,90 @@
 # Updated to match Streamlit interface with all 24+ agents
 
 from fastapi import APIRouter, HTTPException, Body, Query
-from pydantic import BaseModel, validator
-from typing import List, Dict, Any, Optional
-import requests
-from bs4 import BeautifulSoup
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, model_validator
+from typing import ClassVar, List, Dict, Any, Optional, Tuple
 import random
 import asyncio
-from textblob import TextBlob
+import statistics
+import time
+import numpy as np
+from collections import OrderedDict
+from functools import lru_cache
+from urllib.parse import urlparse, urlsplit
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 
 # ============ IMPORT URL EXTRACTOR ============
 import url_extractor
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Shared analyzer: VADER is lexicon-based, so one instance loads the lexicon
+# once and is reusable across requests with no per-call setup cost
+_VADER = SentimentIntensityAnalyzer()
+
+# Shared generator for the simulated metrics: one batched draw per agent call
+# replaces dozens of individual random.randint/uniform round-trips
+_RNG = np.random.default_rng()
+
+# Dedicated stdlib Random for the remaining scalar draws; a private instance
+# skips the module-level singleton the thread-pool agents would otherwise
+# contend on
+_RAND = random.Random()
+
+# Read-only defaults as module-level tuples, so the fallback isn't rebuilt
+# (and isn't mutable) on every call
+_DEFAULT_DIRECTORIES = ("Google My Business", "Yelp", "Yellow Pages", "Bing Places", "Apple Maps")
+_DEFAULT_SOCIAL_PLATFORMS = ("facebook", "twitter", "linkedin", "instagram")
 
 
 # ============ UPDATED PYDANTIC MODELS WITH URL SUPPORT ============
 
+class RequireAnyRequest(BaseModel):
+    """Base for request models that accept URL or manual input.
+
+    Subclasses list the fields that can satisfy the request in
+    _require_any; a single shared validator replaces the dozen identical
+    per-model copies of the same "at least one of" check.
+    """
+    _require_any: ClassVar[Tuple[str, ...]] = ()
+    _require_any_error: ClassVar[str] = "Required input missing"
+
+    @model_validator(mode='after')
+    def validate_input(self):
+        required = type(self)._require_any
+        if required and not any(getattr(self, name) for name in required):
+            raise ValueError(type(self)._require_any_error)
+        return self
+
+
 class BacklinkSource(BaseModel):
     url: str
     domain_authority: Optional[int] = None
     relevance: Optional[str] = None
 
 
-class BacklinkRequest(BaseModel):
+class BacklinkRequest(RequireAnyRequest):
     """Request model for backlink operations - supports URL or manual input"""
+    _require_any = ('url', 'target_domains', 'backlink_data')
+    _require_any_error = 'Either url, target_domains, or backlink_data must be provided'
     url: Optional[str] = None  # NEW: Website URL to analyze
     target_domains: Optional[List[str]] = None  # Competitor URLs
     keywords: Optional[List[str]] = None  # Keywords for sourcing
     niche: Optional[str] = None
     backlink_data: Optional[List[Dict[str, Any]]] = None  # Manual backlink data
 
-    @validator('backlink_data', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url') and not values.get('target_domains'):
-            raise ValueError('Either url, target_domains, or backlink_data must be provided')
-        return v
 
-
-class GuestPostRequest(BaseModel):
+class GuestPostRequest(RequireAnyRequest):
     """Request model for guest posting - supports URL or manual input"""
+    _require_any = ('url', 'niche', 'outreach_list')
+    _require_any_error = 'Either url, niche, or outreach_list must be provided'
     url: Optional[str] = None  # NEW: Target site URL
     niche: Optional[str] = None
     content_samples: Optional[List[str]] = None
     outreach_list: Optional[List[str]] = None  # List of URLs to contact
 
-    @validator('outreach_list', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url') and not values.get('niche'):
-            raise ValueError('Either url, niche, or outreach_list must be provided')
-        return v
-
 
 class OutreachRequest(BaseModel):
     """Request model for outreach campaigns - supports URL or manual input"""
@@ -97,112 +130,80 @@ class AnchorTextRequest(BaseModel):
 
 # ============ UPDATED PYDANTIC MODELS WITH URL SUPPORT ============
 
-class BacklinkProfileRequest(BaseModel):
+class BacklinkProfileRequest(RequireAnyRequest):
     """Request model for backlink profile monitoring - supports URL or manual input"""
+    _require_any = ('url', 'domain')
+    _require_any_error = 'Either url or domain must be provided'
     url: Optional[str] = None  # NEW: Website to monitor
     domain: Optional[str] = None
     monitoring_period: Optional[str] = None
 
-    @validator('domain', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url'):
-            raise ValueError('Either url or domain must be provided')
-        return v
-
 
-class BrandMentionRequest(BaseModel):
+class BrandMentionRequest(RequireAnyRequest):
     """Request model for brand mention detection - supports URL or manual input"""
+    _require_any = ('url', 'brand_name')
+    _require_any_error = 'Either url or brand_name must be provided'
     url: Optional[str] = None  # NEW: Website to extract brand name from
     brand_name: Optional[str] = None
     site_limit: Optional[int] = 50
     mentions: Optional[List[Dict[str, Any]]] = None
     outreach_templates: Optional[List[str]] = None
 
-    @validator('brand_name', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url'):
-            raise ValueError('Either url or brand_name must be provided')
-        return v
 
-
-class BrandSentimentRequest(BaseModel):
+class BrandSentimentRequest(RequireAnyRequest):
     """Request model for brand sentiment analysis - supports URL or manual input"""
+    _require_any = ('url', 'brand_mentions')
+    _require_any_error = 'Either url or brand_mentions must be provided'
     url: Optional[str] = None  # NEW: Website to analyze
     brand_name: Optional[str] = None
     brand_mentions: Optional[List[Dict[str, str]]] = None
 
-    @validator('brand_mentions', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url'):
-            raise ValueError('Either url or brand_mentions must be provided')
-        return v
-
 
-class SocialSignalRequest(BaseModel):
+class SocialSignalRequest(RequireAnyRequest):
     """Request model for social signal collection - supports URL or manual input"""
+    _require_any = ('url',)
+    _require_any_error = 'URL is required for social signal analysis'
     url: Optional[str] = None  # NEW: Content URL to analyze
     social_platforms: Optional[List[str]] = None
 
-    @validator('url', always=True)
-    def validate_input(cls, v, values):
-        if not v:
-            raise ValueError('URL is required for social signal analysis')
-        return v
 
-
-class ForumParticipationRequest(BaseModel):
+class ForumParticipationRequest(RequireAnyRequest):
     """Request model for forum engagement - supports URL or manual input"""
+    _require_any = ('url', 'niche')
+    _require_any_error = 'Either url or niche must be provided'
     url: Optional[str] = None  # NEW: Website to extract niche from
     niche: Optional[str] = None
     target_forums: Optional[List[str]] = None
     engagement_strategy: Optional[Dict[str, str]] = None
 
-    @validator('niche', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url'):
-            raise ValueError('Either url or niche must be provided')
-        return v
-
 
-class CitationRequest(BaseModel):
+class CitationRequest(RequireAnyRequest):
     """Request model for citations - supports URL or manual input"""
+    _require_any = ('url', 'business_data')
+    _require_any_error = 'Either url or business_data must be provided'
     url: Optional[str] = None  # NEW: Business website
     business_data: Optional[Dict[str, str]] = None
     target_directories: Optional[List[str]] = None
     directory_list: Optional[List[Dict[str, Any]]] = None
 
-    @validator('business_data', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url'):
-            raise ValueError('Either url or business_data must be provided')
-        return v
 
-
-class CompetitorBacklinkRequest(BaseModel):
+class CompetitorBacklinkRequest(RequireAnyRequest):
     """Request model for competitor backlink analysis - supports URL or manual input"""
+    _require_any = ('url', 'competitor_urls', 'competitor_domains')
+    _require_any_error = 'Either url, competitor_urls, or competitor_domains required'
     url: Optional[str] = None  # NEW: Competitor URL
     competitor_urls: Optional[List[str]] = None
     competitor_domains: Optional[List[str]] = None
 
-    @validator('competitor_domains', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url') and not values.get('competitor_urls'):
-            raise ValueError('Either url, competitor_urls, or competitor_domains required')
-        return v
-
 
-class SecurityMonitoringRequest(BaseModel):
+class SecurityMonitoringRequest(RequireAnyRequest):
     """Request model for security monitoring - supports URL or manual input"""
+    _require_any = ('url', 'domain')
+    _require_any_error = 'Either url or domain must be provided'
     url: Optional[str] = None  # NEW: Website to monitor
     domain: Optional[str] = None
     monitoring_keywords: Optional[List[str]] = None
 
-    @validator('domain', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url'):
-            raise ValueError('Either url or domain must be provided')
-        return v
-
 
 class PerformanceReportRequest(BaseModel):
     """Request model for performance reporting - supports URL or manual input"""
@@ -211,18 +212,14 @@ class PerformanceReportRequest(BaseModel):
     time_period: Optional[str] = None
 
 
-class ReputationMonitoringRequest(BaseModel):
+class ReputationMonitoringRequest(RequireAnyRequest):
     """Request model for reputation monitoring - supports URL or manual input"""
+    _require_any = ('url', 'brand_name')
+    _require_any_error = 'Either url or brand_name must be provided'
     url: Optional[str] = None  # NEW: Website to monitor
     brand_name: Optional[str] = None
     monitoring_platforms: Optional[List[str]] = None
 
-    @validator('brand_name', always=True)
-    def validate_input(cls, v, values):
-        if not v and not values.get('url'):
-            raise ValueError('Either url or brand_name must be provided')
-        return v
-
 
 # ============ HELPER FUNCTIONS ============
 
@@ -231,43 +228,141 @@ async def run_in_thread(func, *args, **kwargs):
     return await asyncio.to_thread(func, *args, **kwargs)
 
 
+# A client auditing one site tends to hit several of these endpoints with
+# the same URL in quick succession; a small TTL+LRU cache turns those repeat
+# fetch+parse round-trips into dict lookups. The event loop is
+# single-threaded, so no locking is needed around the OrderedDict.
+_EXTRACT_CACHE_MAX = 1024
+_EXTRACT_TTL = 300  # seconds
+_extract_cache = OrderedDict()  # cache key -> (fetched_at, result)
+
+# Single-flight: concurrent requests for the same URL all miss the cache
+# until the first fetch lands, so they share that fetch's task instead of
+# each hitting the origin
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+def _extract_cache_key(url: str) -> str:
+    """Normalize a URL into a cache key (lowercased scheme/host, no fragment)"""
+    parts = urlsplit(url)
+    key = f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path}"
+    if parts.query:
+        key += "?" + parts.query
+    return key
+
+
+async def fetch_extracted(url: str) -> Dict[str, Any]:
+    """Fetch and parse a URL on the shared aiohttp session.
+
+    Keeps the event loop free during the HTTP wait instead of parking a
+    worker thread per in-flight extraction; raises 400 on fetch errors so
+    endpoints can use the result directly. Successful extractions are
+    cached for _EXTRACT_TTL seconds.
+    """
+    key = _extract_cache_key(url)
+    entry = _extract_cache.get(key)
+    if entry and time.monotonic() - entry[0] < _EXTRACT_TTL:
+        _extract_cache.move_to_end(key)
+        return entry[1]
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(url_extractor.extract_async(url))
+        _inflight[key] = task
+        try:
+            extracted = await task
+        finally:
+            _inflight.pop(key, None)
+    else:
+        # shield keeps the owner's fetch alive if this waiter is cancelled
+        extracted = await asyncio.shield(task)
+
+    if "error" in extracted:
+        raise HTTPException(status_code=400, detail=extracted["error"])
+
+    _extract_cache[key] = (time.monotonic(), extracted)
+    _extract_cache.move_to_end(key)
+    while len(_extract_cache) > _EXTRACT_CACHE_MAX:
+        _extract_cache.popitem(last=False)
+    return extracted
+
+
+async def fetch_brand_name(url: str) -> str:
+    """Resolve a URL's brand name without a full-page extraction.
+
+    A cached full extraction is reused when present; otherwise only the
+    <title> fast path is fetched and cached (under its own key), so these
+    endpoints hold one string instead of the whole parsed page.
+    """
+    key = _extract_cache_key(url)
+    now = time.monotonic()
+    for cache_key in (key, key + "#title"):
+        entry = _extract_cache.get(cache_key)
+        if entry and now - entry[0] < _EXTRACT_TTL:
+            _extract_cache.move_to_end(cache_key)
+            return extract_brand_name_from_url(entry[1])
+
+    meta = await url_extractor.extract_title_async(url)
+    if "error" in meta:
+        raise HTTPException(status_code=400, detail=meta["error"])
+
+    _extract_cache[key + "#title"] = (time.monotonic(), meta)
+    while len(_extract_cache) > _EXTRACT_CACHE_MAX:
+        _extract_cache.popitem(last=False)
+    return extract_brand_name_from_url(meta)
+
+
+def links_to_soa(links: List[Dict[str, Any]], k: int) -> Tuple[List[str], List[str]]:
+    """Split the first k link dicts into parallel url/anchor columns.
+
+    Downstream comprehensions then zip plain lists instead of re-hashing
+    the same dict keys for every element.
+    """
+    sliced = links[:k]
+    urls = [link.get("url", "") for link in sliced]
+    anchors = [link.get("anchor_text", "") for link in sliced]
+    return urls, anchors
+
+
 def extract_backlink_info_from_url(extracted_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Extract backlink-related info from URL"""
-    backlinks_info = []
-
     # Extract internal and external links
     external_links = extracted_data.get("external_links", [])
 
-    for link in external_links[:20]:
-        backlinks_info.append({
-            "url": link.get("url", ""),
+    # urlparse via the cached helper instead of split("/")[2], which raised
+    # IndexError for relative or scheme-less links
+    return [
+        {
+            "url": (url := link.get("url", "")),
             "anchor_text": link.get("anchor_text", ""),
-            "domain": link.get("url", "").split("/")[2] if "/" in link.get("url", "") else ""
-        })
-
-    return backlinks_info
+            "domain": extract_domain_from_url(url) if "//" in url else ""
+        }
+        for link in external_links[:20]
+    ]
 
 
 
 def extract_brand_name_from_url(extracted_data: Dict[str, Any]) -> str:
     """Extract brand name from URL metadata"""
-    # Try to get from title first
-    title = extracted_data.get("title", "")
-    if "|" in title:
-        return title.split("|")[0].strip()
+    # partition scans once and needs no separate "|" containment check,
+    # unlike split which builds a list just for its first element
+    title = extracted_data.get("title") or ""
+    brand, sep, _ = title.partition("|")
+    if sep:
+        return brand.strip()
 
     # Try from first h1
     h1_tags = extracted_data.get("h1_tags", [])
     if h1_tags:
-        return h1_tags[0].split("|")[0].strip()
+        return h1_tags[0].partition("|")[0].strip()
 
     # Return title as fallback
     return title or "ExampleBrand"
 
 
+@lru_cache(maxsize=4096)
 def extract_domain_from_url(url: str) -> str:
-    """Extract domain from URL"""
-    from urllib.parse import urlparse
+    """Extract domain from URL (cached - the same URLs recur across endpoints)"""
     parsed = urlparse(url)
     return parsed.netloc or "example.com"
 
@@ -285,7 +380,7 @@ def quality_backlink_sourcing(keywords: list = None, niche: str = None):
         sources.append({
             "keyword": kw,
             "potential_sites": [f"{kw}-authority.com", f"best-{kw}.org", f"{kw}-news.net"],
-            "domain_authority": random.randint(40, 95),
+            "domain_authority": _RAND.randint(40, 95),
             "relevance": "high"
         })
 
@@ -303,8 +398,8 @@ def backlink_acquisition(target_domains: list = None, content_type: str = None):
             "domain": domain,
             "contact_email": f"editor@{domain}",
             "content_type_preference": content_type or "guest_post",
-            "estimated_da": random.randint(30, 80),
-            "outreach_priority": random.choice(["high", "medium", "low"])
+            "estimated_da": _RAND.randint(30, 80),
+            "outreach_priority": _RAND.choice(["high", "medium", "low"])
         })
 
     return {"prospects": prospects, "success_rate_estimate": 0.15}
@@ -314,15 +409,16 @@ def guest_posting(niche: str = None, content_samples: list = None):
     """Researches, pitches, and manages high-quality guest blog opportunities"""
     niche = niche or "digital marketing"
 
+    das = _RNG.integers([40, 50, 35], [71, 81, 66]).tolist()
     opportunities = [
-        {"site": f"{niche}-blog.com", "da": random.randint(40, 70), "guidelines": "1500+ words"},
-        {"site": f"{niche}-insider.org", "da": random.randint(50, 80), "guidelines": "Original research required"},
-        {"site": f"top-{niche}.net", "da": random.randint(35, 65), "guidelines": "No self-promotional links"}
+        {"site": f"{niche}-blog.com", "da": das[0], "guidelines": "1500+ words"},
+        {"site": f"{niche}-insider.org", "da": das[1], "guidelines": "Original research required"},
+        {"site": f"top-{niche}.net", "da": das[2], "guidelines": "No self-promotional links"}
     ]
 
     return {
         "guest_post_opportunities": opportunities,
-        "average_da": sum([op["da"] for op in opportunities]) / len(opportunities),
+        "average_da": sum(op["da"] for op in opportunities) / len(opportunities),
         "content_samples_needed": len(content_samples) if content_samples else 3
     }
 
@@ -335,9 +431,9 @@ def outreach_guest_posting(niche: str = None, outreach_list: list = None):
     for site in outreach_list:
         outreach_results.append({
             "target_site": site,
-            "contact_found": random.choice([True, False]),
-            "response_rate": random.uniform(0.1, 0.4),
-            "status": random.choice(["contacted", "responded", "accepted", "rejected"])
+            "contact_found": _RAND.choice([True, False]),
+            "response_rate": _RAND.uniform(0.1, 0.4),
+            "status": _RAND.choice(["contacted", "responded", "accepted", "rejected"])
         })
 
     return {"outreach_results": outreach_results, "total_contacted": len(outreach_list)}
@@ -348,18 +444,25 @@ def outreach_execution(prospects: list = None, email_templates: list = None):
     if not prospects:
         prospects = [{"domain": "example.com", "contact": "editor@example.com"}]
 
+    n = len(prospects)
+    draws = _RNG.integers([1, 0, 0], [4, 3, 2], size=(n, 3)).tolist()
+    # One getrandbits call yields every conversion flag; bit i belongs to
+    # prospect i
+    conversion_bits = _RAND.getrandbits(n)
+
     execution_report = []
-    for prospect in prospects:
+    for i, prospect in enumerate(prospects):
+        emails_sent, opens, replies = draws[i]
         execution_report.append({
             "prospect": prospect.get("domain", "unknown"),
-            "emails_sent": random.randint(1, 3),
-            "opens": random.randint(0, 2),
-            "replies": random.randint(0, 1),
-            "conversion": random.choice([True, False])
+            "emails_sent": emails_sent,
+            "opens": opens,
+            "replies": replies,
+            "conversion": bool((conversion_bits >> i) & 1)
         })
 
-    total_sent = sum([r["emails_sent"] for r in execution_report])
-    total_replies = sum([r["replies"] for r in execution_report])
+    total_sent = sum(r["emails_sent"] for r in execution_report)
+    total_replies = sum(r["replies"] for r in execution_report)
 
     return {
         "execution_report": execution_report,
@@ -378,14 +481,14 @@ def broken_link_building(niche_websites: list = None, replacement_content: list
             "website": website,
             "broken_links": [
                 {"url": f"http://old-resource{i}.com", "anchor_text": f"Resource {i}"}
-                for i in range(1, random.randint(2, 5))
+                for i in range(1, _RAND.randint(2, 5))
             ],
-            "replacement_opportunities": random.randint(1, 3)
+            "replacement_opportunities": _RAND.randint(1, 3)
         })
 
     return {
         "broken_link_opportunities": broken_links_found,
-        "total_opportunities": sum([len(site["broken_links"]) for site in broken_links_found])
+        "total_opportunities": sum(len(site["broken_links"]) for site in broken_links_found)
     }
 
 
@@ -422,17 +525,21 @@ def lost_backlink_recovery(lost_links: list = None, recovery_templates: list = N
         {"url": "lost-link-2.org", "lost_date": "2024-08-15", "anchor": "Marketing Tips"}
     ]
 
+    # Three boolean outcomes per link in one draw instead of three
+    # random.choice calls each
+    flags = _RNG.integers(0, 2, size=(len(lost_links), 3), dtype=np.bool_).tolist()
+
     recovery_attempts = []
-    for link in lost_links:
+    for link, (responded, restored, alternative) in zip(lost_links, flags):
         recovery_attempts.append({
             "lost_link": link.get("url", ""),
             "recovery_email_sent": True,
-            "response_received": random.choice([True, False]),
-            "link_restored": random.choice([True, False]),
-            "alternative_offered": random.choice([True, False])
+            "response_received": responded,
+            "link_restored": restored,
+            "alternative_offered": alternative
         })
 
-    success_rate = sum([1 for attempt in recovery_attempts if attempt["link_restored"]]) / len(recovery_attempts) if recovery_attempts else 0
+    success_rate = sum(1 for attempt in recovery_attempts if attempt["link_restored"]) / len(recovery_attempts) if recovery_attempts else 0
 
     return {
         "recovery_attempts": recovery_attempts,
@@ -449,18 +556,27 @@ def backlink_quality_evaluator(backlink_data: list = None):
             {"url": "low-quality.com", "da": 20, "spam_score": 85}
         ]
 
-    evaluation_report = []
-    for link in backlink_data:
-        quality_score = (link.get("da", 50) - link.get("spam_score", 0)) / 100 * 100
-        evaluation_report.append({
+    # Score/threshold the whole profile in C instead of per-link Python
+    # arithmetic; matters once profiles reach thousands of links
+    n = len(backlink_data)
+    da = np.fromiter((link.get("da", 50) for link in backlink_data), dtype=np.int64, count=n)
+    spam = np.fromiter((link.get("spam_score", 0) for link in backlink_data), dtype=np.int64, count=n)
+    quality = da - spam
+    ratings = np.where(quality > 60, "high", np.where(quality > 30, "medium", "low")).tolist()
+    actions = np.where(quality > 60, "keep", np.where(quality > 30, "review", "disavow")).tolist()
+
+    evaluation_report = [
+        {
             "url": link.get("url", ""),
             "domain_authority": link.get("da", 0),
-            "spam_score": link.get("spam_score", 0),
-            "quality_rating": "high" if quality_score > 60 else "medium" if quality_score > 30 else "low",
-            "action": "keep" if quality_score > 60 else "review" if quality_score > 30 else "disavow"
-        })
+            "spam_score": spam_score,
+            "quality_rating": rating,
+            "action": action
+        }
+        for link, spam_score, rating, action in zip(backlink_data, spam.tolist(), ratings, actions)
+    ]
 
-    avg_da = sum([link.get("da", 0) for link in backlink_data]) / len(backlink_data) if backlink_data else 0
+    avg_da = sum(link.get("da", 0) for link in backlink_data) / n if n else 0
     return {
         "backlink_evaluation": evaluation_report,
         "average_quality": round(avg_da, 1)
@@ -477,8 +593,16 @@ def anchor_text_diversity_offpage(backlink_profile: dict = None):
             "generic": 20
         }
 
-    total_anchors = sum(backlink_profile.values())
-    percentages = {k: round(v/total_anchors*100, 1) for k, v in backlink_profile.items()}
+    # One pass over the profile: percentages and the nonzero count for the
+    # diversity score together (also guards the all-zero/empty profile,
+    # which used to divide by zero)
+    total_anchors = sum(backlink_profile.values()) or 1
+    percentages = {}
+    nonzero_types = 0
+    for anchor_type, count in backlink_profile.items():
+        pct = round(count / total_anchors * 100, 1)
+        percentages[anchor_type] = pct
+        nonzero_types += pct > 0
 
     recommendations = []
     if percentages["exact_match"] > 20:
@@ -491,7 +615,7 @@ def anchor_text_diversity_offpage(backlink_profile: dict = None):
     return {
         "anchor_distribution": percentages,
         "recommendations": recommendations,
-        "diversity_score": len([v for v in percentages.values() if v > 0]) * 25
+        "diversity_score": nonzero_types * 25
     }
 
 
@@ -504,18 +628,24 @@ def toxic_link_identification_disavowal(backlink_data: list = None, domain: str
             {"url": "quality-site.org", "spam_score": 10}
         ]
 
-    toxic_links = [link for link in backlink_data if link.get("spam_score", 0) > 60]
-    disavow_list = [link.get("url", "") for link in toxic_links]
+    # Vectorized threshold: one C-level comparison over the spam scores,
+    # then gather only the toxic rows
+    spam = np.fromiter((link.get("spam_score", 0) for link in backlink_data),
+                       dtype=np.int64, count=len(backlink_data))
+    toxic_idx = np.flatnonzero(spam > 60)
+    disavow_list = [backlink_data[i].get("url", "") for i in toxic_idx]
 
-    disavow_file_content = "# Disavow file for " + domain + "\n"
-    for toxic_link in disavow_list:
-        disavow_file_content += f"domain:{toxic_link}\n"
+    # Single join instead of += in a loop, which re-copies the whole string
+    # on every toxic link (quadratic for large disavow lists)
+    disavow_file_content = "".join(
+        [f"# Disavow file for {domain}\n"] + [f"domain:{link}\n" for link in disavow_list]
+    )
 
     return {
-        "toxic_links_found": len(toxic_links),
+        "toxic_links_found": len(disavow_list),
         "disavow_list": disavow_list,
         "disavow_file": disavow_file_content,
-        "clean_links": len(backlink_data) - len(toxic_links)
+        "clean_links": len(backlink_data) - len(disavow_list)
     }
 
 
@@ -524,15 +654,17 @@ def backlink_profile_monitor(domain: str = None, monitoring_period: str = None):
     domain = domain or "example.com"
     monitoring_period = monitoring_period or "30_days"
 
+    new_bl, lost_bl, total_bl, ref_domains, traffic = _RNG.integers(
+        [5, 2, 100, 50, 100], [26, 11, 1001, 201, 2001]).tolist()
     monitoring_data = {
         "domain": domain,
         "period": monitoring_period,
-        "new_backlinks": random.randint(5, 25),
-        "lost_backlinks": random.randint(2, 10),
-        "total_backlinks": random.randint(100, 1000),
-        "referring_domains": random.randint(50, 200),
-        "link_velocity": random.uniform(0.5, 3.0),
-        "referral_traffic": random.randint(100, 2000)
+        "new_backlinks": new_bl,
+        "lost_backlinks": lost_bl,
+        "total_backlinks": total_bl,
+        "referring_domains": ref_domains,
+        "link_velocity": float(_RNG.uniform(0.5, 3.0)),
+        "referral_traffic": traffic
     }
 
     net_growth = monitoring_data["new_backlinks"] - monitoring_data["lost_backlinks"]
@@ -552,19 +684,19 @@ def unlinked_brand_mention_finder(brand_name: str = None, site_limit: int = 50):
     brand_name = brand_name or "ExampleBrand"
 
     mentions_found = []
-    for i in range(random.randint(5, 15)):
+    for i in range(_RAND.randint(5, 15)):
         mentions_found.append({
             "site": f"mention-site-{i}.com",
             "mention_text": f"Great article about {brand_name} and their services",
             "url": f"https://mention-site-{i}.com/article-{i}",
-            "domain_authority": random.randint(20, 80),
-            "mention_type": random.choice(["positive", "neutral", "negative"])
+            "domain_authority": _RAND.randint(20, 80),
+            "mention_type": _RAND.choice(["positive", "neutral", "negative"])
         })
 
     return {
         "unlinked_mentions": mentions_found,
         "total_mentions": len(mentions_found),
-        "high_authority_mentions": len([m for m in mentions_found if m["domain_authority"] > 50])
+        "high_authority_mentions": sum(1 for m in mentions_found if m["domain_authority"] > 50)
     }
 
 
@@ -573,17 +705,19 @@ def brand_mention_outreach(mentions: list = None, outreach_templates: list = Non
     if not mentions:
         mentions = [{"site": "example.com", "contact": "editor@example.com"}]
 
+    flags = _RNG.integers(0, 2, size=(len(mentions), 3), dtype=np.bool_).tolist()
+
     outreach_results = []
-    for mention in mentions:
+    for mention, (responded, link_added, relationship) in zip(mentions, flags):
         outreach_results.append({
             "site": mention.get("site", "unknown"),
             "outreach_sent": True,
-            "response_received": random.choice([True, False]),
-            "link_added": random.choice([True, False]),
-            "relationship_built": random.choice([True, False])
+            "response_received": responded,
+            "link_added": link_added,
+            "relationship_built": relationship
         })
 
-    conversion_rate = sum([1 for r in outreach_results if r["link_added"]]) / len(outreach_results) if outreach_results else 0
+    conversion_rate = sum(1 for r in outreach_results if r["link_added"]) / len(outreach_results) if outreach_results else 0
 
     return {
         "outreach_results": outreach_results,
@@ -604,13 +738,10 @@ def brand_mention_sentiment_analysis(brand_mentions: list = None):
     sentiment_scores = []
 
     for mention in brand_mentions:
-        # Use TextBlob for sentiment analysis
-        try:
-            blob = TextBlob(mention.get("text", ""))
-            sentiment_score = blob.sentiment.polarity
-        except:
-            sentiment_score = random.uniform(-1, 1)
-
+        # VADER's compound score replaces the per-mention TextBlob parse;
+        # the shared analyzer avoids re-loading the lexicon on every call
+        text = mention.get("text", "")
+        sentiment_score = _VADER.polarity_scores(text)["compound"]
         sentiment_scores.append(sentiment_score)
 
         if sentiment_score > 0.3:
@@ -621,13 +752,13 @@ def brand_mention_sentiment_analysis(brand_mentions: list = None):
             sentiment = "neutral"
 
         sentiment_analysis.append({
-            "text": mention.get("text", "")[:50] + "...",
+            "text": text[:50] + "...",
             "source": mention.get("source", "unknown"),
             "sentiment": sentiment,
             "score": round(sentiment_score, 2)
         })
 
-    average_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0
+    average_sentiment = statistics.fmean(sentiment_scores) if sentiment_scores else 0
 
     return {
         "sentiment_analysis": sentiment_analysis,
@@ -639,17 +770,19 @@ def brand_mention_sentiment_analysis(brand_mentions: list = None):
 def social_signal_collector(url: str = None, social_platforms: list = None):
     """Tracks mentions and shares across social media platforms"""
     url = url or "https://example.com"
-    social_platforms = social_platforms or ["facebook", "twitter", "linkedin", "instagram"]
+    social_platforms = social_platforms or _DEFAULT_SOCIAL_PLATFORMS
 
+    # One (platforms x 4) draw instead of four randint calls per platform
+    draws = _RNG.integers(0, [501, 1001, 101, 51], size=(len(social_platforms), 4)).tolist()
     social_signals = {}
     total_signals = 0
 
-    for platform in social_platforms:
+    for platform, (shares, likes, comments, mentions) in zip(social_platforms, draws):
         signals = {
-            "shares": random.randint(0, 500),
-            "likes": random.randint(0, 1000),
-            "comments": random.randint(0, 100),
-            "mentions": random.randint(0, 50)
+            "shares": shares,
+            "likes": likes,
+            "comments": comments,
+            "mentions": mentions
         }
         social_signals[platform] = signals
         total_signals += sum(signals.values())
@@ -669,20 +802,23 @@ def forum_participation(niche: str = None, target_forums: list = None):
     niche = niche or "digital marketing"
     target_forums = target_forums or [f"{niche}-forum.com", "reddit.com", "quora.com"]
 
+    draws = _RNG.integers([2, 5, 10], [11, 51, 201], size=(len(target_forums), 3)).tolist()
+    levels = _RNG.choice(["beginner", "contributor", "expert"], size=len(target_forums)).tolist()
+
     participation_report = []
-    for forum in target_forums:
+    for forum, (posts, responses, karma), level in zip(target_forums, draws, levels):
         participation_report.append({
             "forum": forum,
-            "posts_made": random.randint(2, 10),
-            "responses_received": random.randint(5, 50),
-            "upvotes_karma": random.randint(10, 200),
-            "authority_level": random.choice(["beginner", "contributor", "expert"])
+            "posts_made": posts,
+            "responses_received": responses,
+            "upvotes_karma": karma,
+            "authority_level": level
         })
 
     return {
         "participation_report": participation_report,
-        "total_posts": sum([p["posts_made"] for p in participation_report]),
-        "total_engagement": sum([p["responses_received"] for p in participation_report])
+        "total_posts": sum(p["posts_made"] for p in participation_report),
+        "total_engagement": sum(p["responses_received"] for p in participation_report)
     }
 
 
@@ -703,9 +839,9 @@ def forum_engagement(niche: str = None, engagement_strategy: dict = None):
 
     engagement_metrics = {
         "communities_active": len(communities),
-        "weekly_posts": random.randint(5, 20),
-        "average_upvotes": random.randint(3, 15),
-        "followers_gained": random.randint(10, 100)
+        "weekly_posts": _RAND.randint(5, 20),
+        "average_upvotes": _RAND.randint(3, 15),
+        "followers_gained": _RAND.randint(10, 100)
     }
 
     return {
@@ -726,20 +862,21 @@ def citation_directory_listing(business_data: dict = None, target_directories: l
             "phone": "555-123-4567"
         }
 
-    target_directories = target_directories or [
-        "Google My Business", "Yelp", "Yellow Pages", "Bing Places", "Apple Maps"
-    ]
+    target_directories = target_directories or _DEFAULT_DIRECTORIES
+
+    statuses = _RNG.choice(["listed", "pending", "not_listed"], size=len(target_directories)).tolist()
+    nap_flags = _RNG.integers(0, 2, size=len(target_directories), dtype=np.bool_).tolist()
 
     listing_status = []
-    for directory in target_directories:
+    for directory, status, nap_consistent in zip(target_directories, statuses, nap_flags):
         listing_status.append({
             "directory": directory,
-            "status": random.choice(["listed", "pending", "not_listed"]),
-            "nap_consistent": random.choice([True, False]),
+            "status": status,
+            "nap_consistent": nap_consistent,
             "last_updated": "2024-10-01"
         })
 
-    consistency_score = sum([1 for ls in listing_status if ls["nap_consistent"]]) / len(listing_status) * 100 if listing_status else 0
+    consistency_score = sum(1 for ls in listing_status if ls["nap_consistent"]) / len(listing_status) * 100 if listing_status else 0
 
     return {
         "business_data": business_data,
@@ -768,35 +905,55 @@ def directory_submissions(business_data: dict = None, directory_list: list = Non
 
     return {
         "submission_plan": submission_plan,
-        "high_priority_directories": len([d for d in submission_plan if d["priority"] == "high"]),
+        "high_priority_directories": sum(1 for d in submission_plan if d["priority"] == "high"),
         "estimated_cost": "varies by directory"
     }
 
 
 # ============ SECTION 5: MONITORING, REPORTING & CLEANUP ============
 
-def competitor_backlink_analysis(competitor_domains: list = None):
-    """Continually analyzes competitors' backlink sources for new opportunities"""
-    competitor_domains = competitor_domains or ["competitor1.com", "competitor2.com"]
+# Bounds the per-competitor fan-out below so a long competitor list can't
+# hammer a backlink data source once the analysis is backed by live fetches
+COMPETITOR_SEM = asyncio.Semaphore(20)
+
 
-    competitor_analysis = []
-    for domain in competitor_domains:
-        analysis = {
+async def _analyze_competitor(domain: str, total: int, referring: int,
+                              source_links: list, gap: int) -> dict:
+    """Analyze one competitor domain; runs concurrently with its siblings"""
+    async with COMPETITOR_SEM:
+        return {
             "domain": domain,
-            "total_backlinks": random.randint(500, 5000),
-            "referring_domains": random.randint(100, 800),
+            "total_backlinks": total,
+            "referring_domains": referring,
             "top_link_sources": [
-                {"site": f"authority-{i}.com", "links": random.randint(5, 50)}
-                for i in range(1, 6)
+                {"site": f"authority-{i}.com", "links": links}
+                for i, links in enumerate(source_links, start=1)
             ],
             "common_anchor_texts": ["brand name", "homepage", "learn more", "industry term"],
-            "link_gap_opportunities": random.randint(20, 100)
+            "link_gap_opportunities": gap
         }
-        competitor_analysis.append(analysis)
+
+
+async def competitor_backlink_analysis(competitor_domains: list = None):
+    """Continually analyzes competitors' backlink sources for new opportunities"""
+    competitor_domains = competitor_domains or ["competitor1.com", "competitor2.com"]
+
+    n = len(competitor_domains)
+    totals = _RNG.integers(500, 5001, size=n).tolist()
+    referring = _RNG.integers(100, 801, size=n).tolist()
+    source_links = _RNG.integers(5, 51, size=(n, 5)).tolist()
+    gaps = _RNG.integers(20, 101, size=n).tolist()
+
+    # Per-domain coroutines overlap on the event loop, so wall-clock cost
+    # stays max-of-domains rather than sum once real lookups are wired in
+    competitor_analysis = await asyncio.gather(*(
+        _analyze_competitor(domain, totals[i], referring[i], source_links[i], gaps[i])
+        for i, domain in enumerate(competitor_domains)
+    ))
 
     return {
-        "competitor_analysis": competitor_analysis,
-        "total_opportunities_identified": sum([c["link_gap_opportunities"] for c in competitor_analysis])
+        "competitor_analysis": list(competitor_analysis),
+        "total_opportunities_identified": sum(c["link_gap_opportunities"] for c in competitor_analysis)
     }
 
 
@@ -805,11 +962,13 @@ def spam_negative_seo_defense(domain: str = None, monitoring_keywords: list = No
     domain = domain or "example.com"
     monitoring_keywords = monitoring_keywords or ["brand", "company", "product"]
 
+    suspicious, attempts = _RNG.integers([0, 0], [11, 4]).tolist()
+    velocity, spam_increase = _RNG.uniform([0, 0], [2.0, 15.0]).tolist()
     threat_analysis = {
-        "suspicious_backlinks": random.randint(0, 10),
-        "negative_seo_attempts": random.randint(0, 3),
-        "toxic_link_velocity": random.uniform(0, 2.0),
-        "spam_score_increase": random.uniform(0, 15)
+        "suspicious_backlinks": suspicious,
+        "negative_seo_attempts": attempts,
+        "toxic_link_velocity": velocity,
+        "spam_score_increase": spam_increase
     }
 
     defense_actions = []
@@ -841,19 +1000,27 @@ def offpage_performance_reporting(metrics_data: dict = None, time_period: str =
             "social_signals": 2300
         }
 
+    # Fetch each metric once; the same values feed both the insight checks
+    # and the weighted score
+    new_backlinks = metrics_data.get("new_backlinks", 0)
+    lost_backlinks = metrics_data.get("lost_backlinks", 0)
+    referral_traffic = metrics_data.get("referral_traffic", 0)
+    brand_mentions = metrics_data.get("brand_mentions", 0)
+    social_signals = metrics_data.get("social_signals", 0)
+
     insights = []
-    if metrics_data.get("new_backlinks", 0) > metrics_data.get("lost_backlinks", 0):
+    if new_backlinks > lost_backlinks:
         insights.append("Positive link growth trend")
-    if metrics_data.get("referral_traffic", 0) > 1000:
+    if referral_traffic > 1000:
         insights.append("Strong referral traffic performance")
-    if metrics_data.get("brand_mentions", 0) > 30:
+    if brand_mentions > 30:
         insights.append("Good brand visibility online")
 
     performance_score = (
-        metrics_data.get("new_backlinks", 0) * 2 +
-        metrics_data.get("referral_traffic", 0) / 100 +
-        metrics_data.get("brand_mentions", 0) +
-        metrics_data.get("social_signals", 0) / 100
+        new_backlinks * 2 +
+        referral_traffic / 100 +
+        brand_mentions +
+        social_signals / 100
     ) / 4
 
     return {
@@ -871,21 +1038,26 @@ def reputation_monitoring(brand_name: str = None, monitoring_platforms: list = N
         "Google Reviews", "Yelp", "Facebook", "Twitter", "Reddit", "Industry Forums"
     ]
 
-    reputation_data = []
-    overall_sentiment = []
+    # One draw per column across all platforms; mean/sum then run on the
+    # arrays instead of Python loops
+    n = len(monitoring_platforms)
+    mentions = _RNG.integers(5, 101, size=n)
+    ratings = _RNG.uniform(3.0, 5.0, size=n)
+    sentiments = _RNG.uniform(-1, 1, size=n)
+    trends = _RNG.choice(["positive", "neutral", "negative"], size=n).tolist()
 
-    for platform in monitoring_platforms:
-        platform_data = {
+    reputation_data = [
+        {
             "platform": platform,
-            "mentions_found": random.randint(5, 100),
-            "average_rating": random.uniform(3.0, 5.0),
-            "sentiment_score": random.uniform(-1, 1),
-            "trending": random.choice(["positive", "neutral", "negative"])
+            "mentions_found": int(mentions[i]),
+            "average_rating": float(ratings[i]),
+            "sentiment_score": float(sentiments[i]),
+            "trending": trends[i]
         }
-        reputation_data.append(platform_data)
-        overall_sentiment.append(platform_data["sentiment_score"])
+        for i, platform in enumerate(monitoring_platforms)
+    ]
 
-    average_sentiment = sum(overall_sentiment) / len(overall_sentiment) if overall_sentiment else 0
+    average_sentiment = float(sentiments.mean()) if n else 0
     reputation_health = "excellent" if average_sentiment > 0.5 else "good" if average_sentiment > 0 else "needs_attention"
 
     return {
@@ -893,7 +1065,7 @@ def reputation_monitoring(brand_name: str = None, monitoring_platforms: list = N
         "reputation_data": reputation_data,
         "overall_sentiment": round(average_sentiment, 2),
         "reputation_health": reputation_health,
-        "total_mentions": sum([p["mentions_found"] for p in reputation_data])
+        "total_mentions": int(mentions.sum())
     }
 
 
@@ -907,29 +1079,21 @@ async def api_quality_backlink_sourcing(request: BacklinkRequest):
     - If URL: Analyzes website and extracts external links
     - If keywords: Researches based on keywords
     """
-    try:
-        if request.url:
-            # Extract from URL
-            extracted = await run_in_thread(url_extractor.extract, request.url)
+    if request.url:
+        # Extract from URL
+        extracted = await fetch_extracted(request.url)
 
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+        # Extract backlink info from URL
+        backlinks_info = extract_backlink_info_from_url(extracted)
+        backlinks = [b.get("url", "") for b in backlinks_info[:10]]
 
-            # Extract backlink info from URL
-            backlinks_info = extract_backlink_info_from_url(extracted)
-            backlinks = [b.get("url", "") for b in backlinks_info[:10]]
-
-            result = await run_in_thread(quality_backlink_sourcing, backlinks, request.niche)
-            result["source_url"] = request.url
-            result["extracted_links"] = len(backlinks_info)
-        else:
-            result = await run_in_thread(quality_backlink_sourcing, request.keywords, request.niche)
+        result = await run_in_thread(quality_backlink_sourcing, backlinks, request.niche)
+        result["source_url"] = request.url
+        result["extracted_links"] = len(backlinks_info)
+    else:
+        result = await run_in_thread(quality_backlink_sourcing, request.keywords, request.niche)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/backlink_acquisition")
@@ -940,27 +1104,19 @@ async def api_backlink_acquisition(request: BacklinkRequest):
     - If URL: Analyzes website links
     - If target_domains: Recommends prospects
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+        # Extract external links
+        external_links = extracted.get("external_links", [])
+        target_domains = [link.get("url", "") for link in external_links[:10]]
 
-            # Extract external links
-            external_links = extracted.get("external_links", [])
-            target_domains = [link.get("url", "") for link in external_links[:10]]
-
-            result = await run_in_thread(backlink_acquisition, target_domains, None)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(backlink_acquisition, request.target_domains, None)
+        result = await run_in_thread(backlink_acquisition, target_domains, None)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(backlink_acquisition, request.target_domains, None)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/guest_posting")
@@ -971,27 +1127,19 @@ async def api_guest_posting(request: GuestPostRequest):
     - If URL: Analyzes niche from website
     - If niche: Researches opportunities
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            # Extract niche from title if not provided
-            niche = request.niche or extracted.get("title", "marketing").lower()
+        # Extract niche from title if not provided
+        niche = request.niche or extracted.get("title", "marketing").lower()
 
-            result = await run_in_thread(guest_posting, niche, request.content_samples)
-            result["source_url"] = request.url
-            result["page_title"] = extracted.get("title")
-        else:
-            result = await run_in_thread(guest_posting, request.niche, request.content_samples)
+        result = await run_in_thread(guest_posting, niche, request.content_samples)
+        result["source_url"] = request.url
+        result["page_title"] = extracted.get("title")
+    else:
+        result = await run_in_thread(guest_posting, request.niche, request.content_samples)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/outreach_guest_posting")
@@ -1002,28 +1150,20 @@ async def api_outreach_guest_posting(request: GuestPostRequest):
     - If URL: Extracts from links
     - If outreach_list: Uses provided list
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+        # Extract external links as outreach targets
+        external_links = extracted.get("external_links", [])
+        outreach_list = [link.get("url", "") for link in external_links[:5]]
+        niche = request.niche or extracted.get("title", "").lower()
 
-            # Extract external links as outreach targets
-            external_links = extracted.get("external_links", [])
-            outreach_list = [link.get("url", "") for link in external_links[:5]]
-            niche = request.niche or extracted.get("title", "").lower()
-
-            result = await run_in_thread(outreach_guest_posting, niche, outreach_list)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(outreach_guest_posting, request.niche, request.outreach_list)
+        result = await run_in_thread(outreach_guest_posting, niche, outreach_list)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(outreach_guest_posting, request.niche, request.outreach_list)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/outreach_execution")
@@ -1034,27 +1174,23 @@ async def api_outreach_execution(request: OutreachRequest):
     - If URL: Extracts targets
     - If prospects: Uses provided list
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
-
-            # Create prospects from links
-            external_links = extracted.get("external_links", [])
-            prospects = [{"domain": link.get("url", "").split("/")[2], "contact": f"info@{link.get('url', '').split('/')[2]}"} for link in external_links[:5]]
-
-            result = await run_in_thread(outreach_execution, prospects, request.email_templates)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(outreach_execution, request.prospects, request.email_templates)
+    if request.url:
+        extracted = await fetch_extracted(request.url)
+
+        # Create prospects from links, resolving each link's host once
+        # instead of split("/")[2] twice per entry
+        external_links = extracted.get("external_links", [])
+        prospects = []
+        for link in external_links[:5]:
+            host = extract_domain_from_url(link.get("url", ""))
+            prospects.append({"domain": host, "contact": f"info@{host}"})
+
+        result = await run_in_thread(outreach_execution, prospects, request.email_templates)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(outreach_execution, request.prospects, request.email_templates)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/broken_link_building")
@@ -1065,27 +1201,19 @@ async def api_broken_link_building(request: BacklinkRequest):
     - If URL: Analyzes for broken links
     - If target_domains: Researches list
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            # Use external links as niche websites
-            external_links = extracted.get("external_links", [])
-            niche_websites = [link.get("url", "") for link in external_links[:5]]
+        # Use external links as niche websites
+        external_links = extracted.get("external_links", [])
+        niche_websites = [link.get("url", "") for link in external_links[:5]]
 
-            result = await run_in_thread(broken_link_building, niche_websites, None)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(broken_link_building, request.target_domains, None)
+        result = await run_in_thread(broken_link_building, niche_websites, None)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(broken_link_building, request.target_domains, None)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/skyscraper_content_outreach")
@@ -1096,28 +1224,20 @@ async def api_skyscraper_content(request: SkyscraperRequest):
     - If URL: Analyzes competitor content
     - If content_topic: Analyzes topic
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            # Extract topic from page title
-            content_topic = request.content_topic or extracted.get("title", "SEO Guide")
+        # Extract topic from page title
+        content_topic = request.content_topic or extracted.get("title", "SEO Guide")
 
-            result = await run_in_thread(skyscraper_content_outreach, content_topic, None)
-            result["source_url"] = request.url
-            result["page_title"] = extracted.get("title")
-            result["word_count"] = len(extracted.get("text_content", "").split())
-        else:
-            result = await run_in_thread(skyscraper_content_outreach, request.content_topic, request.competitor_content)
+        result = await run_in_thread(skyscraper_content_outreach, content_topic, None)
+        result["source_url"] = request.url
+        result["page_title"] = extracted.get("title")
+        result["word_count"] = len(extracted.get("text_content", "").split())
+    else:
+        result = await run_in_thread(skyscraper_content_outreach, request.content_topic, request.competitor_content)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/lost_backlink_recovery")
@@ -1128,27 +1248,20 @@ async def api_lost_backlink_recovery(request: LinkRecoveryRequest):
     - If URL: Analyzes to find lost links
     - If lost_links: Recovers provided links
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+        # Simulate lost links from external links
+        urls, anchors = links_to_soa(extracted.get("external_links", []), 3)
+        lost_links = [{"url": url, "lost_date": "2024-09-01", "anchor": anchor}
+                      for url, anchor in zip(urls, anchors)]
 
-            # Simulate lost links from external links
-            external_links = extracted.get("external_links", [])
-            lost_links = [{"url": link.get("url", ""), "lost_date": "2024-09-01", "anchor": link.get("anchor_text", "")} for link in external_links[:3]]
-
-            result = await run_in_thread(lost_backlink_recovery, lost_links, request.recovery_templates)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(lost_backlink_recovery, request.lost_links, request.recovery_templates)
+        result = await run_in_thread(lost_backlink_recovery, lost_links, request.recovery_templates)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(lost_backlink_recovery, request.lost_links, request.recovery_templates)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/backlink_quality_evaluator")
@@ -1159,28 +1272,23 @@ async def api_backlink_quality_evaluator(request: LinkQualityRequest):
     - If URL: Analyzes website backlinks
     - If backlink_data: Evaluates provided data
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            # Create backlink data from external links
-            external_links = extracted.get("external_links", [])
-            backlink_data = [{"url": link.get("url", ""), "da": random.randint(30, 80), "spam_score": random.randint(0, 50)} for link in external_links[:10]]
+        # Create backlink data from external links with one batched draw
+        urls, _ = links_to_soa(extracted.get("external_links", []), 10)
+        das = _RNG.integers(30, 81, size=len(urls)).tolist()
+        spams = _RNG.integers(0, 51, size=len(urls)).tolist()
+        backlink_data = [{"url": url, "da": da, "spam_score": spam}
+                         for url, da, spam in zip(urls, das, spams)]
 
-            result = await run_in_thread(backlink_quality_evaluator, backlink_data)
-            result["source_url"] = request.url
-            result["total_links_analyzed"] = len(backlink_data)
-        else:
-            result = await run_in_thread(backlink_quality_evaluator, request.backlink_data)
+        result = await run_in_thread(backlink_quality_evaluator, backlink_data)
+        result["source_url"] = request.url
+        result["total_links_analyzed"] = len(backlink_data)
+    else:
+        result = await run_in_thread(backlink_quality_evaluator, request.backlink_data)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/anchor_text_diversity")
@@ -1191,32 +1299,38 @@ async def api_anchor_text_diversity(request: AnchorTextRequest):
     - If URL: Extracts from links
     - If backlink_profile: Analyzes provided data
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
-
-            # Create anchor text profile from extracted links
-            external_links = extracted.get("external_links", [])
-            backlink_profile = {
-                "exact_match": len([l for l in external_links if l.get("anchor_text", "").lower() in extracted.get("text_content", "").lower()]),
-                "partial_match": len([l for l in external_links if any(w in l.get("anchor_text", "").lower() for w in extracted.get("text_content", "").lower().split())]),
-                "branded": len([l for l in external_links if "brand" in l.get("anchor_text", "").lower()]),
-                "generic": len([l for l in external_links if l.get("anchor_text", "").lower() in ["click here", "learn more", "read more"]])
-            }
-
-            result = await run_in_thread(anchor_text_diversity_offpage, backlink_profile)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(anchor_text_diversity_offpage, request.backlink_profile)
+    if request.url:
+        extracted = await fetch_extracted(request.url)
+
+        # Create anchor text profile from extracted links. Lowercase and
+        # tokenize the page text once, then classify every anchor in a
+        # single pass - the old four comprehensions re-lowered the full
+        # text per link and substring-scanned it per token
+        external_links = extracted.get("external_links", [])
+        text_lower = extracted.get("text_content", "").lower()
+        token_set = set(text_lower.split())
+        generic_set = {"click here", "learn more", "read more"}
+
+        backlink_profile = {"exact_match": 0, "partial_match": 0, "branded": 0, "generic": 0}
+        for link in external_links:
+            anchor = link.get("anchor_text", "").lower()
+            if not anchor:
+                continue
+            if anchor in text_lower:
+                backlink_profile["exact_match"] += 1
+            if any(w in token_set for w in anchor.split()):
+                backlink_profile["partial_match"] += 1
+            if "brand" in anchor:
+                backlink_profile["branded"] += 1
+            if anchor in generic_set:
+                backlink_profile["generic"] += 1
+
+        result = await run_in_thread(anchor_text_diversity_offpage, backlink_profile)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(anchor_text_diversity_offpage, request.backlink_profile)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/toxic_link_detection")
@@ -1227,29 +1341,23 @@ async def api_toxic_link_detection(request: TOXICLinkRequest):
     - If URL: Analyzes website links
     - If backlink_data: Analyzes provided data
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+        # Create backlink data from external links with one batched draw
+        urls, _ = links_to_soa(extracted.get("external_links", []), 10)
+        spams = _RNG.integers(0, 96, size=len(urls)).tolist()
+        backlink_data = [{"url": url, "spam_score": spam}
+                         for url, spam in zip(urls, spams)]
 
-            # Create backlink data from external links
-            external_links = extracted.get("external_links", [])
-            backlink_data = [{"url": link.get("url", ""), "spam_score": random.randint(0, 95)} for link in external_links[:10]]
+        domain = request.domain or extracted.get("title", "example.com").split("|")[0].strip()
 
-            domain = request.domain or extracted.get("title", "example.com").split("|")[0].strip()
-
-            result = await run_in_thread(toxic_link_identification_disavowal, backlink_data, domain)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(toxic_link_identification_disavowal, request.backlink_data, request.domain)
+        result = await run_in_thread(toxic_link_identification_disavowal, backlink_data, domain)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(toxic_link_identification_disavowal, request.backlink_data, request.domain)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
     
 # Complete Off-Page SEO Agents Module - UPDATED WITH URL SUPPORT (PART 2: Remaining Sections)
 # Backlink Profile Monitor + Brand Mentions + Social Signals + Forums + Citations + Monitoring
@@ -1270,24 +1378,16 @@ async def api_backlink_profile_monitor(request: BacklinkProfileRequest):
     - If URL: Extracts domain from website
     - If domain: Uses provided domain
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            domain = extract_domain_from_url(request.url)
-            result = await run_in_thread(backlink_profile_monitor, domain, request.monitoring_period)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(backlink_profile_monitor, request.domain, request.monitoring_period)
+        domain = extract_domain_from_url(request.url)
+        result = await run_in_thread(backlink_profile_monitor, domain, request.monitoring_period)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(backlink_profile_monitor, request.domain, request.monitoring_period)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/unlinked_brand_mention_finder")
@@ -1298,24 +1398,14 @@ async def api_unlinked_brand_mention_finder(request: BrandMentionRequest):
     - If URL: Extracts brand name from website
     - If brand_name: Uses provided name
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
-
-            brand_name = extract_brand_name_from_url(extracted)
-            result = await run_in_thread(unlinked_brand_mention_finder, brand_name, request.site_limit)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(unlinked_brand_mention_finder, request.brand_name, request.site_limit)
+    if request.url:
+        brand_name = await fetch_brand_name(request.url)
+        result = await run_in_thread(unlinked_brand_mention_finder, brand_name, request.site_limit)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(unlinked_brand_mention_finder, request.brand_name, request.site_limit)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/brand_mention_outreach")
@@ -1326,25 +1416,15 @@ async def api_brand_mention_outreach(request: BrandMentionRequest):
     - If URL: Extracts brand name for context
     - If mentions: Uses provided mentions
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
-
-            brand_name = extract_brand_name_from_url(extracted)
-            result = await run_in_thread(brand_mention_outreach, request.mentions, request.outreach_templates)
-            result["source_url"] = request.url
-            result["brand_name"] = brand_name
-        else:
-            result = await run_in_thread(brand_mention_outreach, request.mentions, request.outreach_templates)
+    if request.url:
+        brand_name = await fetch_brand_name(request.url)
+        result = await run_in_thread(brand_mention_outreach, request.mentions, request.outreach_templates)
+        result["source_url"] = request.url
+        result["brand_name"] = brand_name
+    else:
+        result = await run_in_thread(brand_mention_outreach, request.mentions, request.outreach_templates)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/brand_mention_sentiment")
@@ -1355,27 +1435,19 @@ async def api_brand_sentiment(request: BrandSentimentRequest):
     - If URL: Analyzes website content for sentiment
     - If brand_mentions: Analyzes provided mentions
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            # Create brand mentions from text content
-            text = extracted.get("text_content", "")
-            brand_mentions = [{"text": text[:200], "source": request.url}] if text else []
+        # Create brand mentions from text content
+        text = extracted.get("text_content", "")
+        brand_mentions = [{"text": text[:200], "source": request.url}] if text else []
 
-            result = await run_in_thread(brand_mention_sentiment_analysis, brand_mentions)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(brand_mention_sentiment_analysis, request.brand_mentions)
+        result = await run_in_thread(brand_mention_sentiment_analysis, brand_mentions)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(brand_mention_sentiment_analysis, request.brand_mentions)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/social_signal_collector")
@@ -1386,15 +1458,10 @@ async def api_social_signal_collector(request: SocialSignalRequest):
     - Analyzes URL for social media mentions
     - Tracks engagement metrics
     """
-    try:
-        result = await run_in_thread(social_signal_collector, request.url, request.social_platforms)
-        result["source_url"] = request.url
+    result = await run_in_thread(social_signal_collector, request.url, request.social_platforms)
+    result["source_url"] = request.url
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/forum_participation")
@@ -1405,24 +1472,16 @@ async def api_forum_participation(request: ForumParticipationRequest):
     - If URL: Extracts niche from website
     - If niche: Uses provided niche
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
-
-            niche = request.niche or extracted.get("title", "marketing").lower()
-            result = await run_in_thread(forum_participation, niche, request.target_forums)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(forum_participation, request.niche, request.target_forums)
+        niche = request.niche or extracted.get("title", "marketing").lower()
+        result = await run_in_thread(forum_participation, niche, request.target_forums)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(forum_participation, request.niche, request.target_forums)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/forum_engagement")
@@ -1433,24 +1492,16 @@ async def api_forum_engagement(request: ForumParticipationRequest):
     - If URL: Extracts niche from website
     - If niche: Uses provided niche
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            niche = request.niche or extracted.get("title", "SEO").lower()
-            result = await run_in_thread(forum_engagement, niche, request.engagement_strategy)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(forum_engagement, request.niche, request.engagement_strategy)
+        niche = request.niche or extracted.get("title", "SEO").lower()
+        result = await run_in_thread(forum_engagement, niche, request.engagement_strategy)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(forum_engagement, request.niche, request.engagement_strategy)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/citation_directory_listing")
@@ -1461,25 +1512,17 @@ async def api_citation_directory_listing(request: CitationRequest):
     - If URL: Extracts business info from website
     - If business_data: Uses provided data
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            # Try to extract business info
-            business_data = {"name": extracted.get("title", ""), "address": "", "phone": ""}
-            result = await run_in_thread(citation_directory_listing, business_data, request.target_directories)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(citation_directory_listing, request.business_data, request.target_directories)
+        # Try to extract business info
+        business_data = {"name": extracted.get("title", ""), "address": "", "phone": ""}
+        result = await run_in_thread(citation_directory_listing, business_data, request.target_directories)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(citation_directory_listing, request.business_data, request.target_directories)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/directory_submissions")
@@ -1490,24 +1533,16 @@ async def api_directory_submissions(request: CitationRequest):
     - If URL: Analyzes for submission
     - If business_data: Uses provided data
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
+    if request.url:
+        extracted = await fetch_extracted(request.url)
 
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
-
-            business_data = {"name": extracted.get("title", "")}
-            result = await run_in_thread(directory_submissions, business_data, request.directory_list)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(directory_submissions, request.business_data, request.directory_list)
+        business_data = {"name": extracted.get("title", "")}
+        result = await run_in_thread(directory_submissions, business_data, request.directory_list)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(directory_submissions, request.business_data, request.directory_list)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/competitor_backlink_analysis")
@@ -1518,22 +1553,17 @@ async def api_competitor_backlink_analysis(request: CompetitorBacklinkRequest):
     - If URL: Uses as competitor URL
     - If competitor_domains: Uses provided list
     """
-    try:
-        if request.url:
-            competitor_domains = [extract_domain_from_url(request.url)]
-            result = await run_in_thread(competitor_backlink_analysis, competitor_domains)
-            result["source_url"] = request.url
-        elif request.competitor_urls:
-            domains = [extract_domain_from_url(u) for u in request.competitor_urls]
-            result = await run_in_thread(competitor_backlink_analysis, domains)
-        else:
-            result = await run_in_thread(competitor_backlink_analysis, request.competitor_domains)
+    if request.url:
+        competitor_domains = [extract_domain_from_url(request.url)]
+        result = await competitor_backlink_analysis(competitor_domains)
+        result["source_url"] = request.url
+    elif request.competitor_urls:
+        domains = [extract_domain_from_url(u) for u in request.competitor_urls]
+        result = await competitor_backlink_analysis(domains)
+    else:
+        result = await competitor_backlink_analysis(request.competitor_domains)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/spam_defense")
@@ -1544,19 +1574,14 @@ async def api_spam_defense(request: SecurityMonitoringRequest):
     - If URL: Extracts domain for monitoring
     - If domain: Uses provided domain
     """
-    try:
-        if request.url:
-            domain = extract_domain_from_url(request.url)
-            result = await run_in_thread(spam_negative_seo_defense, domain, request.monitoring_keywords)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(spam_negative_seo_defense, request.domain, request.monitoring_keywords)
+    if request.url:
+        domain = extract_domain_from_url(request.url)
+        result = await run_in_thread(spam_negative_seo_defense, domain, request.monitoring_keywords)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(spam_negative_seo_defense, request.domain, request.monitoring_keywords)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/offpage_performance_report")
@@ -1566,17 +1591,12 @@ async def api_offpage_performance_report(request: PerformanceReportRequest):
 
     - Analyzes metrics and provides insights
     """
-    try:
-        result = await run_in_thread(offpage_performance_reporting, request.metrics_data, request.time_period)
+    result = await run_in_thread(offpage_performance_reporting, request.metrics_data, request.time_period)
 
-        if request.url:
-            result["source_url"] = request.url
+    if request.url:
+        result["source_url"] = request.url
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 @router.post("/reputation_monitoring")
@@ -1587,24 +1607,14 @@ async def api_reputation_monitoring(request: ReputationMonitoringRequest):
     - If URL: Extracts brand name from website
     - If brand_name: Uses provided name
     """
-    try:
-        if request.url:
-            extracted = await run_in_thread(url_extractor.extract, request.url)
-
-            if "error" in extracted:
-                raise HTTPException(status_code=400, detail=extracted["error"])
-
-            brand_name = extract_brand_name_from_url(extracted)
-            result = await run_in_thread(reputation_monitoring, brand_name, request.monitoring_platforms)
-            result["source_url"] = request.url
-        else:
-            result = await run_in_thread(reputation_monitoring, request.brand_name, request.monitoring_platforms)
+    if request.url:
+        brand_name = await fetch_brand_name(request.url)
+        result = await run_in_thread(reputation_monitoring, brand_name, request.monitoring_platforms)
+        result["source_url"] = request.url
+    else:
+        result = await run_in_thread(reputation_monitoring, request.brand_name, request.monitoring_platforms)
 
-        return {"status": "SUCCESS", "result": result}
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    return {"status": "SUCCESS", "result": result}
 
 
 
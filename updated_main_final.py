@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import sys
 from pathlib import Path
 
@@ -76,6 +77,9 @@ app = FastAPI(
 - **Scalable Architecture**: Microservices-ready design
     """,
     version="2.0.0",
+    # orjson serializes the dict-heavy agent payloads several times faster
+    # than the stdlib json encoder
+    default_response_class=ORJSONResponse,
     contact={
         "name": "SEO Platform Support",
         "email": "support@seoplatform.com",
@@ -86,6 +90,13 @@ app = FastAPI(
     },
 )
 
+# Centralized catch-all: agent routers raise HTTPException for expected
+# failures and let anything else surface here as a 500, instead of each
+# handler wrapping its body in an identical try/except
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request, exc):
+    return ORJSONResponse({"detail": str(exc)}, status_code=500)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -243,6 +254,16 @@ app.include_router(
 @app.on_event("startup")
 async def startup_event():
     """Initialize platform on startup"""
+    # The stock default executor caps at min(32, cpus+4) threads, which
+    # starves the I/O-heavy asyncio.to_thread call sites across the agent
+    # routers under load; size it for concurrent blocking fetches instead
+    import asyncio
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(
+        max_workers=int(os.getenv("THREAD_POOL_SIZE", "128")),
+        thread_name_prefix="seo-io",
+    ))
     print("🚀 SEO Orchestration Platform starting up...")
     print("📊 Loading 226+ micro-agents...")
     print("🌐 Initializing URL extractor...")
@@ -256,6 +277,8 @@ async def shutdown_event():
     """Cleanup on shutdown"""
     print("🛑 SEO Orchestration Platform shutting down...")
     print("💾 Saving agent states...")
+    import url_extractor
+    await url_extractor.aclose()
     print("✅ Shutdown completed successfully")
 
 if __name__ == "__main__":
@@ -4,13 +4,33 @@ URL Content Extractor Utility for SEO Analysis
 Extracts SEO-relevant data from any given URL
 """
 
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse, urljoin
 import re
 
 
+# Shared pooled session for the sync path: same-host fetches (e.g. several
+# GMB pages) reuse keep-alive connections instead of re-handshaking TLS
+_SESSION = requests.Session()
+for _scheme in ("http://", "https://"):
+    _SESSION.mount(_scheme, HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    ))
+
+
 class URLContentExtractor:
     """Extracts comprehensive SEO data from URLs"""
 
@@ -28,29 +48,15 @@ class URLContentExtractor:
             if not parsed.scheme or not parsed.netloc:
                 return {"error": "Invalid URL format. Include http:// or https://"}
 
-            response = requests.get(url, headers=self.headers, timeout=self.timeout, allow_redirects=True)
+            response = _SESSION.get(url, headers=self.headers, timeout=(3, self.timeout), allow_redirects=True)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            return {
-                "url": url,
-                "status_code": response.status_code,
-                "text_content": self._extract_text(soup),
-                "html_content": str(soup),
-                "title": self._extract_title(soup),
-                "meta_description": self._get_meta_tag(soup, 'description'),
-                "meta_keywords": self._get_meta_tag(soup, 'keywords'),
-                "h1_tags": [h.get_text(strip=True) for h in soup.find_all('h1')],
-                "h2_tags": [h.get_text(strip=True) for h in soup.find_all('h2')],
-                "h3_tags": [h.get_text(strip=True) for h in soup.find_all('h3')],
-                "images": self._extract_images(soup, url),
-                "internal_links": self._extract_internal_links(soup, url),
-                "external_links": self._extract_external_links(soup, url),
-                "schema_markup": self._extract_schema(soup),
-                "page_size_kb": len(response.content) / 1024,
-                "response_time_ms": response.elapsed.total_seconds() * 1000,
-            }
+            return self._build_result(
+                url,
+                response.content,
+                response.status_code,
+                response.elapsed.total_seconds() * 1000,
+            )
 
         except requests.exceptions.Timeout:
             return {"error": f"Request timeout after {self.timeout} seconds"}
@@ -61,6 +67,31 @@ class URLContentExtractor:
         except Exception as e:
             return {"error": f"Error: {str(e)}"}
 
+    def _build_result(self, url: str, content: bytes, status_code: int, response_time_ms: float) -> Dict[str, Any]:
+        """Parse fetched HTML and assemble the extraction result"""
+        soup = BeautifulSoup(content, 'html.parser')
+        schemas = self._extract_schema(soup)
+
+        return {
+            "url": url,
+            "status_code": status_code,
+            "text_content": self._extract_text(soup),
+            "html_content": str(soup),
+            "title": self._extract_title(soup),
+            "meta_description": self._get_meta_tag(soup, 'description'),
+            "meta_keywords": self._get_meta_tag(soup, 'keywords'),
+            "h1_tags": [h.get_text(strip=True) for h in soup.find_all('h1')],
+            "h2_tags": [h.get_text(strip=True) for h in soup.find_all('h2')],
+            "h3_tags": [h.get_text(strip=True) for h in soup.find_all('h3')],
+            "images": self._extract_images(soup, url),
+            "internal_links": self._extract_internal_links(soup, url),
+            "external_links": self._extract_external_links(soup, url),
+            "schema_markup": schemas,
+            "schema_by_type": self._index_schemas(schemas),
+            "page_size_kb": len(content) / 1024,
+            "response_time_ms": response_time_ms,
+        }
+
     def _extract_text(self, soup) -> str:
         """Extract clean text content"""
         for script in soup(['script', 'style', 'noscript']):
@@ -131,13 +162,31 @@ class URLContentExtractor:
 
         return external[:30]
 
+    def _index_schemas(self, schemas: List[Dict]) -> Dict[str, Dict]:
+        """Index JSON-LD blocks by @type so consumers get O(1) lookups.
+
+        A list-valued @type registers the block under each of its types;
+        the first block seen for a type wins.
+        """
+        by_type = {}
+        for schema in schemas:
+            if not isinstance(schema, dict):
+                continue
+            schema_type = schema.get("@type")
+            types = [schema_type] if isinstance(schema_type, str) else schema_type or ()
+            for t in types:
+                if isinstance(t, str):
+                    by_type.setdefault(t, schema)
+        return by_type
+
     def _extract_schema(self, soup) -> List[Dict]:
         """Extract JSON-LD schema markup"""
         schemas = []
         for script in soup.find_all('script', type='application/ld+json'):
             try:
-                import json
-                schema_data = json.loads(script.string)
+                # encode() also converts bs4's NavigableString, which orjson
+                # rejects as a str subclass
+                schema_data = orjson.loads(script.string.encode())
                 schemas.append(schema_data)
             except:
                 pass
@@ -153,3 +202,107 @@ def extract(url: str):
 
 # Global instance (optional shared extractor)
 url_extractor = URLContentExtractor()
+
+
+# ------------------------------------------------------------
+# Async extraction: non-blocking fetch over a shared keep-alive connection
+# pool so fan-out extractions (competitor URLs) overlap instead of queueing
+# on worker threads. HTML parsing still happens off the event loop.
+
+_FETCH_SEM = asyncio.Semaphore(32)
+_async_session: Optional[aiohttp.ClientSession] = None
+_async_session_lock = asyncio.Lock()
+
+# Dedicated executor for HTML parsing so parse-heavy extractions don't
+# starve the default to_thread pool that agent functions share
+_PARSE_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="html-parse")
+
+
+async def _get_async_session() -> aiohttp.ClientSession:
+    """Create the shared aiohttp session lazily (needs a running loop)"""
+    global _async_session
+    if _async_session is None or _async_session.closed:
+        async with _async_session_lock:
+            if _async_session is None or _async_session.closed:
+                _async_session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=64, limit_per_host=8, keepalive_timeout=30),
+                    timeout=aiohttp.ClientTimeout(total=url_extractor.timeout),
+                    headers=url_extractor.headers,
+                )
+    return _async_session
+
+
+async def aclose() -> None:
+    """Release the shared aiohttp session and parse executor (app shutdown)"""
+    global _async_session
+    if _async_session is not None and not _async_session.closed:
+        await _async_session.close()
+    _async_session = None
+    _PARSE_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+
+# Callers that only need the page title (brand-name lookups) shouldn't pay
+# for a full download and parse; read until </title> shows up, capped so a
+# title-less page doesn't buffer the whole body
+_TITLE_READ_CAP = 64 * 1024
+
+
+async def extract_title_async(url: str) -> Dict[str, Any]:
+    """Fetch just the page title - same error shape as extract_async"""
+    try:
+        parsed = urlparse(url)
+        if not parsed.scheme or not parsed.netloc:
+            return {"error": "Invalid URL format. Include http:// or https://"}
+
+        session = await _get_async_session()
+        async with _FETCH_SEM:
+            async with session.get(url, allow_redirects=True) as response:
+                response.raise_for_status()
+                content = b""
+                async for chunk in response.content.iter_chunked(8192):
+                    content += chunk
+                    if b"</title>" in content or len(content) >= _TITLE_READ_CAP:
+                        break
+
+        soup = BeautifulSoup(content, 'html.parser', parse_only=SoupStrainer('title'))
+        title_tag = soup.find('title')
+        return {"title": title_tag.get_text(strip=True) if title_tag else None}
+
+    except asyncio.TimeoutError:
+        return {"error": f"Request timeout after {url_extractor.timeout} seconds"}
+    except aiohttp.ClientResponseError as e:
+        return {"error": f"HTTP Error: {e.status}"}
+    except aiohttp.ClientConnectionError:
+        return {"error": "Failed to connect to the URL"}
+    except Exception as e:
+        return {"error": f"Error: {str(e)}"}
+
+
+async def extract_async(url: str) -> Dict[str, Any]:
+    """Async counterpart of extract() - same result shape and error handling"""
+    try:
+        parsed = urlparse(url)
+        if not parsed.scheme or not parsed.netloc:
+            return {"error": "Invalid URL format. Include http:// or https://"}
+
+        session = await _get_async_session()
+        async with _FETCH_SEM:
+            start = time.monotonic()
+            async with session.get(url, allow_redirects=True) as response:
+                content = await response.read()
+                response_time_ms = (time.monotonic() - start) * 1000
+                response.raise_for_status()
+                status_code = response.status
+
+        return await asyncio.get_running_loop().run_in_executor(
+            _PARSE_EXECUTOR, url_extractor._build_result, url, content, status_code, response_time_ms
+        )
+
+    except asyncio.TimeoutError:
+        return {"error": f"Request timeout after {url_extractor.timeout} seconds"}
+    except aiohttp.ClientResponseError as e:
+        return {"error": f"HTTP Error: {e.status}"}
+    except aiohttp.ClientConnectionError:
+        return {"error": "Failed to connect to the URL"}
+    except Exception as e:
+        return {"error": f"Error: {str(e)}"}